@@ -1,13 +1,20 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 from langchain_community.vectorstores import Chroma
 from langchain_community.embeddings import HuggingFaceEmbeddings
-from langchain.chains import RetrievalQA
 from langchain_community.llms import Ollama
-from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
 import os
 import re
+import json
+import time
+import hashlib
+import queue
+import asyncio
+import threading
 import datetime
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+import numpy as np
+import orjson
 import pandas as pd
 from utils.database_manager import CharlestonDB
 
@@ -15,6 +22,7 @@ from utils.database_manager import CharlestonDB
 db_path = os.path.abspath("data/charleston_db")
 events_db_path = os.path.abspath("data/charleston_events_db")
 combined_db_path = os.path.abspath("data/charleston_combined_db")
+onnx_model_path = os.path.abspath("data/minilm-l6-v2-int8.onnx")
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -24,13 +32,342 @@ vector_db = None
 events_db = None
 combined_db = None
 sql_db = None
-qa_chain = None
 llm = None
-chat_chain = None  # New LLM chain for chat conversations
+embeddings = None
+
+# The chatbot prompt, rendered directly with str.format per request.
+# Calling the LLM directly skips LangChain's chain dispatch, callback
+# manager and per-call PromptTemplate reflection.
+CHAT_PROMPT = """
+You are CharlestonConcierge, a helpful and friendly local guide for Charleston, South Carolina.
+Always start your response with a friendly greeting like "Awesome!" or "Happy to help!" or similar.
+
+Based on the user's query and the provided context, suggest relevant businesses or places.
+Present the results in a numbered list format.
+
+**Formatting Instructions:**
+1.  Provide a friendly opening phrase.
+2.  For the **first** item in the list, provide the name and location. Then, on new lines indented with spaces, provide:
+    *   A detailed description.
+    *   Any relevant events happening at that location (if mentioned in the context).
+3.  For **all subsequent** items (2nd, 3rd, etc.), provide only the name, location, and a brief description on a single line.
+4.  If no relevant information is found in the context, politely state that.
+
+**Context from Charleston Database:**
+{context}
+
+**User Query:**
+{question}
+
+**Your Formatted Response:**
+"""
+
+# Time-reference patterns compiled once at module load; the keyword list,
+# MM/DD dates and "Month DD" dates are fused into a single alternation so
+# each chat request costs one regex pass instead of a dozen substring scans
+TIME_REFERENCE_RE = re.compile(
+    r'\b(?:today|tonight|tomorrow|this weekend|weekend|this week|next week|'
+    r'monday|tuesday|wednesday|thursday|friday|saturday|sunday)\b'
+    r'|\d{1,2}/\d{1,2}'
+    r'|(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]* \d{1,2}',
+    re.IGNORECASE
+)
+TODAY_RE = re.compile(r'today|tonight', re.IGNORECASE)
+TOMORROW_RE = re.compile(r'tomorrow', re.IGNORECASE)
+WEEKEND_RE = re.compile(r'this weekend|weekend', re.IGNORECASE)
+
+# HNSW parameters for the Chroma collections. k=5 retrieval over a
+# Charleston-scale corpus (low thousands of vectors) keeps full recall
+# with a much smaller search beam than Chroma's default ef.
+# collection_metadata only takes effect when a collection is first
+# created; the stores loaded here already exist on disk, so the
+# query-time beam width is applied after load (see _apply_hnsw_search_ef).
+HNSW_METADATA = {"hnsw:search_ef": 32, "hnsw:M": 16}
+
+# Query cache settings for the vector search and LLM response caches
+VECTOR_CACHE_TTL = 300  # seconds before a cached result is considered stale
+VECTOR_CACHE_MAX = 256  # maximum number of cached queries
+SEMANTIC_HIT_THRESHOLD = 0.97  # cosine similarity for a near-duplicate query hit
+
+# Concurrent chat generations dispatched to Ollama at once. LangChain's
+# Ollama.generate serializes its prompt list into one HTTP call per
+# prompt, so overlap has to come from client-side threads; the Ollama
+# server then schedules the concurrent requests itself.
+LLM_MAX_CONCURRENCY = 4
+
+# Per-process pool for chat generations, created lazily because pools
+# don't survive fork() under a preloading gunicorn (see _get_llm_executor)
+_llm_executor = None
+_llm_executor_pid = None
+_llm_executor_lock = threading.Lock()
+
+# Cache entries map normalized query -> (timestamp, embedding, results).
+# Both caches are shared across gunicorn's request threads, so every
+# mutation (and the semantic scan's snapshot) happens under its lock.
+_vector_cache = OrderedDict()
+_vector_cache_lock = threading.Lock()
+# LLM response cache maps (context_hash, question_hash) -> (timestamp, response)
+_llm_cache = OrderedDict()
+_llm_cache_lock = threading.Lock()
+
+class BatchedHuggingFaceEmbeddings:
+    """
+    Wrapper around HuggingFaceEmbeddings that micro-batches concurrent
+    embed_query calls.
+
+    Single-sentence MiniLM encodes on CPU are dominated by per-call
+    Python/torch overhead, so queries from concurrent /api/chat requests
+    arriving within a short window are coalesced into one encode() call.
+    A background thread drains the queue whenever it reaches max_batch_size
+    entries or max_batch_timeout_ms elapses, then resolves each caller's
+    future with its own embedding.
+
+    The HuggingFaceEmbeddings instance is wrapped rather than subclassed:
+    it is a pydantic model that forbids extra fields, so the queue and
+    worker thread can't live on a subclass instance.
+    """
+
+    max_batch_size = 32
+    max_batch_timeout_ms = 20
+
+    def __init__(self, *args, **kwargs):
+        self._hf = HuggingFaceEmbeddings(*args, **kwargs)
+        self._batch_queue = queue.Queue()
+        self._batch_lock = threading.Lock()
+        self._batch_thread = None
+
+    def _ensure_batch_thread(self):
+        """Start the batch worker in the current process if it isn't running.
+
+        Threads don't survive fork(), so under a preloading gunicorn the
+        thread started in the master is dead in every worker; each process
+        lazily starts its own on first use.
+        """
+        if self._batch_thread is not None and self._batch_thread.is_alive():
+            return
+        with self._batch_lock:
+            if self._batch_thread is None or not self._batch_thread.is_alive():
+                # A dead thread means this is a freshly forked worker; the
+                # inherited queue still holds the master thread's stale
+                # condition waiter, which would swallow the first notify,
+                # so the restarted worker gets a fresh queue
+                if self._batch_thread is not None:
+                    self._batch_queue = queue.Queue()
+                self._batch_thread = threading.Thread(target=self._batch_loop, daemon=True)
+                self._batch_thread.start()
+
+    def embed_documents(self, texts):
+        """Embed document texts; bulk calls are already batched upstream"""
+        return self._hf.embed_documents(texts)
+
+    def _batch_loop(self):
+        """Collect queued (text, future) pairs and encode them in one call"""
+        timeout = self.max_batch_timeout_ms / 1000.0
+        while True:
+            # Block until at least one query arrives
+            batch = [self._batch_queue.get()]
+            deadline = time.time() + timeout
+
+            # Coalesce whatever else arrives within the batching window
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._batch_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                vectors = self._hf.client.encode(
+                    texts,
+                    batch_size=self.max_batch_size,
+                    normalize_embeddings=True
+                )
+                for (_, future), vector in zip(batch, vectors):
+                    future.set_result(list(map(float, vector)))
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+
+    def embed_query(self, text):
+        """Queue the query for batched encoding and wait for its embedding"""
+        self._ensure_batch_thread()
+        future = Future()
+        self._batch_queue.put((text, future))
+        return future.result()
+
+
+def cached_vector_search(query, k=5):
+    """
+    Vector search with a two-level query cache.
+
+    Exact repeats of a query (after lowercasing/stripping) return the cached
+    results directly. Near-duplicate queries are detected by comparing the
+    query embedding against cached embeddings (cosine similarity), so
+    rephrasings like "bars downtown" vs "Bars downtown " also short-circuit
+    the MiniLM forward pass and the Chroma lookup.
+    """
+    normalized = query.lower().strip()
+    now = time.time()
+
+    # Exact hit on the normalized query
+    with _vector_cache_lock:
+        entry = _vector_cache.get(normalized)
+        if entry is not None:
+            timestamp, _, results = entry
+            if now - timestamp < VECTOR_CACHE_TTL:
+                _vector_cache.move_to_end(normalized)
+                return results
+            del _vector_cache[normalized]
+
+    # Embed once; reuse the vector for both the semantic scan and the cache entry
+    query_embedding = None
+    if embeddings is not None:
+        query_embedding = np.asarray(embeddings.embed_query(normalized), dtype=np.float32)
+        query_embedding /= (np.linalg.norm(query_embedding) or 1.0)
+
+        # Semantic hit: compare against all fresh cached embeddings in one
+        # dot product. The scan works on a snapshot so concurrent inserts
+        # and evictions can't mutate the dict mid-iteration.
+        with _vector_cache_lock:
+            snapshot = list(_vector_cache.items())
+
+        cached_keys = []
+        cached_vectors = []
+        for key, (timestamp, vector, _) in snapshot:
+            if vector is not None and now - timestamp < VECTOR_CACHE_TTL:
+                cached_keys.append(key)
+                cached_vectors.append(vector)
+
+        if cached_vectors:
+            similarities = np.stack(cached_vectors) @ query_embedding
+            best = int(np.argmax(similarities))
+            if similarities[best] >= SEMANTIC_HIT_THRESHOLD:
+                hit_key = cached_keys[best]
+                with _vector_cache_lock:
+                    hit = _vector_cache.get(hit_key)
+                    # The entry can be evicted between snapshot and here
+                    if hit is not None:
+                        _vector_cache.move_to_end(hit_key)
+                        return hit[2]
+
+    # Cache miss: run the real similarity search. The embedding computed
+    # for the semantic scan is reused via the by-vector query so a novel
+    # query costs one MiniLM forward pass, not two; the store's relevance
+    # function maps the raw distances onto the same scores the text query
+    # would have returned.
+    if query_embedding is not None:
+        relevance_fn = combined_db._select_relevance_score_fn()
+        results = [
+            (doc, relevance_fn(score))
+            for doc, score in combined_db.similarity_search_by_vector_with_relevance_scores(
+                query_embedding.tolist(), k=k
+            )
+        ]
+    else:
+        results = combined_db.similarity_search_with_relevance_scores(query, k=k)
+
+    with _vector_cache_lock:
+        _vector_cache[normalized] = (now, query_embedding, results)
+        while len(_vector_cache) > VECTOR_CACHE_MAX:
+            _vector_cache.popitem(last=False)
+
+    return results
+
+def _get_llm_executor():
+    """Return this process's generation pool, creating it on first use.
+
+    Threads don't survive fork(), so under a preloading gunicorn a pool
+    inherited from the master would never run its work items; each
+    process builds its own, keyed by pid.
+    """
+    global _llm_executor, _llm_executor_pid
+    if _llm_executor is not None and _llm_executor_pid == os.getpid():
+        return _llm_executor
+    with _llm_executor_lock:
+        if _llm_executor is None or _llm_executor_pid != os.getpid():
+            _llm_executor = ThreadPoolExecutor(max_workers=LLM_MAX_CONCURRENCY)
+            _llm_executor_pid = os.getpid()
+    return _llm_executor
+
+def submit_prompt(prompt):
+    """Dispatch a prompt to the generation pool; returns a Future of the text"""
+    return _get_llm_executor().submit(llm.invoke, prompt)
+
+def _llm_cache_key(context, question):
+    """
+    Build a normalized cache key for an LLM response.
+
+    When the question's time reference resolves to a concrete date
+    ("today", "tomorrow", "this weekend"), the keyword is stripped and the
+    resolved date folded into the key, so "today" and "Tonight " share an
+    entry while "today" and "tomorrow" never can — even when their
+    retrieved contexts happen to coincide. Unresolved references
+    ("friday", "next week") stay in the key text, scoped to the asking
+    date so answers still can't leak across days.
+    """
+    intent = parse_time_intent(question)
+    norm_question = question.lower().strip()
+    if intent.date_filter:
+        norm_question = TIME_REFERENCE_RE.sub('', norm_question)
+    key = hashlib.blake2b(context.encode() + b'|' + norm_question.encode())
+    if intent.date_filter:
+        key.update(intent.date_filter.encode())
+    elif intent.has_time_reference:
+        key.update(datetime.date.today().isoformat().encode())
+    return key.hexdigest()
+
+def cached_chat_response(context, question):
+    """
+    Run the chat prompt through the LLM with an LRU cache keyed by the normalized
+    (context, question) hash, so repeated questions over identical
+    retrieved context skip Ollama entirely.
+
+    Returns (response, cache_hit) so callers can report cache status.
+    """
+    key = _llm_cache_key(context, question)
+    now = time.time()
+
+    with _llm_cache_lock:
+        entry = _llm_cache.get(key)
+        if entry is not None:
+            timestamp, response = entry
+            if now - timestamp < VECTOR_CACHE_TTL:
+                _llm_cache.move_to_end(key)
+                return response, True
+            del _llm_cache[key]
+
+    response = submit_prompt(CHAT_PROMPT.format(context=context, question=question)).result()
+
+    with _llm_cache_lock:
+        _llm_cache[key] = (now, response)
+        while len(_llm_cache) > VECTOR_CACHE_MAX:
+            _llm_cache.popitem(last=False)
+
+    return response, False
+
+def _apply_hnsw_search_ef(store):
+    """
+    Set the query-time HNSW beam width on an already-persisted collection.
+
+    chromadb ignores collection_metadata for collections that already
+    exist — the normal case here, since the stores are built offline —
+    so hnsw:search_ef has to be applied to the loaded collection with
+    modify(). hnsw:M is fixed when the index is built and is left alone.
+    """
+    try:
+        store._collection.modify(
+            metadata={"hnsw:search_ef": HNSW_METADATA["hnsw:search_ef"]}
+        )
+    except Exception as e:
+        print(f"Failed to set hnsw:search_ef on existing collection: {e}")
+    return store
 
 def init_rag_system():
     """Initialize the RAG system with vector database and SQL database"""
-    global vector_db, events_db, combined_db, sql_db, qa_chain, llm, chat_chain
+    global vector_db, events_db, combined_db, sql_db, llm, embeddings
     
     print("Initializing RAG system...")
     
@@ -42,131 +379,123 @@ def init_rag_system():
         print(f"Failed to connect to SQL database: {e}")
         sql_db = None
     
-    # Initialize embeddings
-    embeddings = HuggingFaceEmbeddings(
-        model_name="all-MiniLM-L6-v2",
-        model_kwargs={'device': 'cpu'}
-    )
+    # Initialize embeddings: prefer the int8 ONNX model if it has been
+    # exported (2-4x faster MiniLM encodes on CPU), otherwise fall back
+    # to the torch model (batched so concurrent queries share one call)
+    embeddings = None
+    if os.path.exists(onnx_model_path):
+        try:
+            from utils.onnx_embeddings import OnnxMiniLMEmbeddings
+            embeddings = OnnxMiniLMEmbeddings(onnx_model_path)
+            print("Using int8 ONNX MiniLM embeddings")
+        except Exception as e:
+            print(f"Failed to load ONNX embeddings, falling back to torch: {e}")
+
+    if embeddings is None:
+        embeddings = BatchedHuggingFaceEmbeddings(
+            model_name="all-MiniLM-L6-v2",
+            model_kwargs={'device': 'cpu'}
+        )
     
     # First check if combined database exists
     if os.path.exists(combined_db_path):
         print("Loading combined database with businesses and events...")
-        combined_db = Chroma(
+        combined_db = _apply_hnsw_search_ef(Chroma(
             persist_directory=combined_db_path,
-            embedding_function=embeddings
-        )
+            embedding_function=embeddings,
+            collection_metadata=HNSW_METADATA
+        ))
     else:
         # Load the business vector database
         print("Loading business database...")
-        vector_db = Chroma(
+        vector_db = _apply_hnsw_search_ef(Chroma(
             persist_directory=db_path,
-            embedding_function=embeddings
-        )
+            embedding_function=embeddings,
+            collection_metadata=HNSW_METADATA
+        ))
         
         # Load events database if it exists
         if os.path.exists(events_db_path):
             print("Loading events database...")
-            events_db = Chroma(
+            events_db = _apply_hnsw_search_ef(Chroma(
                 persist_directory=events_db_path,
-                embedding_function=embeddings
-            )
+                embedding_function=embeddings,
+                collection_metadata=HNSW_METADATA
+            ))
     
     # Initialize Ollama for generative responses
     print("Initializing Ollama LLM...")
     try:
-        # Try to use mistral (or whatever model you have installed)
-        llm = Ollama(model="mistral")
-        
-        # Create a chatbot prompt template
-        chat_template = """
-        You are CharlestonConcierge, a helpful and friendly local guide for Charleston, South Carolina.
-        Always start your response with a friendly greeting like "Awesome!" or "Happy to help!" or similar.
-
-        Based on the user's query and the provided context, suggest relevant businesses or places.
-        Present the results in a numbered list format.
-
-        **Formatting Instructions:**
-        1.  Provide a friendly opening phrase.
-        2.  For the **first** item in the list, provide the name and location. Then, on new lines indented with spaces, provide:
-            *   A detailed description.
-            *   Any relevant events happening at that location (if mentioned in the context).
-        3.  For **all subsequent** items (2nd, 3rd, etc.), provide only the name, location, and a brief description on a single line.
-        4.  If no relevant information is found in the context, politely state that.
-
-        **Context from Charleston Database:**
-        {context}
-        
-        **User Query:**
-        {question}
-        
-        **Your Formatted Response:**
-        """
-        
-        chat_prompt = PromptTemplate(
-            template=chat_template,
-            input_variables=["context", "question"]
-        )
-        
-        # Create a simple chat chain
-        chat_chain = LLMChain(
-            llm=llm,
-            prompt=chat_prompt
+        # Try to use mistral (or whatever model you have installed).
+        # A smaller num_ctx trims KV-cache reads per token, the biggest
+        # latency lever for llama.cpp-backed models.
+        llm = Ollama(
+            model="mistral",
+            num_ctx=2048,
+            num_predict=512,
+            num_thread=os.cpu_count()
         )
-        
-        # Also create a retrieval chain based on which database is available
-        if combined_db:
-            qa_chain = RetrievalQA.from_chain_type(
-                llm=llm,
-                chain_type="stuff",
-                retriever=combined_db.as_retriever(search_kwargs={"k": 5})
-            )
-        elif vector_db:
-            qa_chain = RetrievalQA.from_chain_type(
-                llm=llm,
-                chain_type="stuff",
-                retriever=vector_db.as_retriever(search_kwargs={"k": 5})
-            )
-        
-        print("Ollama LLM and chat chain initialized!")
+
+        print("Ollama LLM initialized!")
     except Exception as e:
         print(f"Failed to initialize Ollama: {e}")
         print("Running without LLM capabilities")
         llm = None
-        qa_chain = None
-        chat_chain = None
     
+    # Warm the heavy components in the background so the first real request
+    # doesn't pay the cold-start cost (HNSW pages faulted in, embedding
+    # operator caches populated, Ollama KV allocator primed)
+    threading.Thread(target=_warm_rag_system, daemon=True).start()
+
     print("RAG system initialization complete!")
 
+def _warm_rag_system():
+    """Issue one dummy vector search and LLM call to reach steady-state latency"""
+    try:
+        warm_db = combined_db or vector_db
+        if warm_db is not None:
+            warm_db.similarity_search("hello", k=1)
+            print("Vector store warmed")
+    except Exception as e:
+        print(f"Vector store warmup failed: {e}")
+
+    try:
+        if llm is not None:
+            llm.invoke("hi")
+            print("Ollama warmed")
+    except Exception as e:
+        print(f"Ollama warmup failed: {e}")
+
 @app.route('/')
 def index():
     """Render the main page with chat interface"""
     return render_template('chat.html')
 
 @app.route('/api/chat', methods=['POST'])
-def chat():
+async def chat():
     """API endpoint for chat interaction"""
     data = request.json
     user_message = data.get('message', '')
-    
+
     if not user_message:
         return jsonify({'error': 'No message provided'}), 400
-    
-    # Get relevant information from databases
-    context = get_context_for_chat(user_message)
-    
+
+    # Get relevant information from databases (SQL stages run concurrently)
+    context = await get_context_for_chat(user_message)
+
     # If we have a language model, use it to generate a response
-    if chat_chain and llm:
+    if llm:
         try:
-            # Generate response using the chat chain
-            response = chat_chain.run({
-                "context": context,
-                "question": user_message
-            })
-            
-            return jsonify({
+            # Generate response off the event loop (cached for repeat questions)
+            loop = asyncio.get_running_loop()
+            response, cache_hit = await loop.run_in_executor(None, cached_chat_response, context, user_message)
+
+            result = jsonify({
                 'response': response,
                 'has_results': len(context) > 0
             })
+            result.headers['X-Cache'] = 'HIT' if cache_hit else 'MISS'
+            return result
         except Exception as e:
             print(f"Error generating LLM response: {e}")
             # Fall back to simple response
@@ -181,209 +510,299 @@ def chat():
             'has_results': False
         })
 
-def get_context_for_chat(user_message):
+@app.route('/api/chat/stream', methods=['POST'])
+def chat_stream():
+    """API endpoint that streams chat tokens to the client as SSE.
+
+    Streaming cuts time-to-first-token from the full generation time to a
+    single decode step, so the user sees the response begin immediately.
+    """
+    data = request.json
+    user_message = data.get('message', '')
+
+    if not user_message:
+        return jsonify({'error': 'No message provided'}), 400
+
+    # Get relevant information from databases
+    context = asyncio.run(get_context_for_chat(user_message))
+
+    if llm is None:
+        return jsonify({
+            'response': "I don't have enough information about that yet. Try asking about Charleston businesses or events.",
+            'has_results': False
+        })
+
+    prompt = CHAT_PROMPT.format(context=context, question=user_message)
+
+    def generate():
+        try:
+            for chunk in llm.stream(prompt):
+                yield f"data: {json.dumps({'token': chunk})}\n\n"
+            yield "data: [DONE]\n\n"
+        except Exception as e:
+            print(f"Error streaming LLM response: {e}")
+            yield f"data: {json.dumps({'error': 'Response stream failed'})}\n\n"
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream')
+
+TimeIntent = namedtuple('TimeIntent', ['has_time_reference', 'date_filter', 'cleaned_query'])
+
+def _weekend_start(today):
+    """Find the next Saturday (today if it already is Saturday)"""
+    return today + datetime.timedelta(days=(5 - today.weekday()) % 7)
+
+# Keyword -> (target-date handler, pattern used to strip the keyword).
+# Order matters: earlier entries win, matching the old if/elif priority.
+_TIME_KEYWORD_HANDLERS = [
+    ('today', lambda today: today, TODAY_RE),
+    ('tonight', lambda today: today, TODAY_RE),
+    ('tomorrow', lambda today: today + datetime.timedelta(days=1), TOMORROW_RE),
+    ('this weekend', _weekend_start, WEEKEND_RE),
+    ('weekend', _weekend_start, WEEKEND_RE),
+]
+
+def parse_time_intent(query):
+    """
+    Parse the time references out of a query once per request.
+
+    Returns a TimeIntent with the resolved date filter (YYYY-MM-DD or None)
+    and the query with the matched date words stripped, so downstream code
+    doesn't re-lowercase and re-scan the message for the same keywords.
+    """
+    has_time_reference = contains_time_reference(query)
+    date_filter = None
+    cleaned_query = query
+
+    if has_time_reference:
+        query_lower = query.lower()
+        today = datetime.datetime.now()
+
+        for keyword, handler, strip_re in _TIME_KEYWORD_HANDLERS:
+            if keyword in query_lower:
+                date_filter = handler(today).strftime('%Y-%m-%d')
+                cleaned_query = strip_re.sub('', query).strip()
+                break
+
+    return TimeIntent(has_time_reference, date_filter, cleaned_query)
+
+def _fetch_events(intent):
+    """Blocking SQL fetch for the events section, applying any date filter"""
+    if intent.date_filter:
+        events = sql_db.get_events_by_date(intent.date_filter)
+        # If no events on exact date but we have a time reference, get all events
+        if events.empty and intent.has_time_reference:
+            events = sql_db.search_events(intent.cleaned_query, limit=5)
+    else:
+        events = sql_db.search_events(intent.cleaned_query, limit=5)
+
+    return events
+
+async def get_context_for_chat(user_message, intent=None):
     """Get relevant context from databases for the chat"""
-    context = ""
-    
-    # Check if the query contains time references
-    has_time_reference = contains_time_reference(user_message)
-    
+    lines = []
+    loop = asyncio.get_running_loop()
+
+    # Parse time references once; callers may pass a pre-parsed intent
+    if intent is None:
+        intent = parse_time_intent(user_message)
+
     # Get businesses from SQL
     if sql_db:
-        # Get matching businesses
-        businesses = sql_db.search_businesses(user_message, limit=3)
-        
+        # Run the business and event searches concurrently: each is an
+        # independent SQLite round trip, so the wall time is max() not sum()
+        businesses, events = await asyncio.gather(
+            loop.run_in_executor(None, sql_db.search_businesses_full, user_message, 3),
+            loop.run_in_executor(None, _fetch_events, intent)
+        )
+
         if not businesses.empty:
-            context += "BUSINESSES:\n"
-            
-            for _, business in businesses.iterrows():
-                # Get categories
-                categories_df = sql_db.get_business_categories(business['id'])
-                categories = ", ".join(categories_df['name'].tolist()) if not categories_df.empty else "No categories"
-                
-                # Get events at this business
-                business_events = sql_db.get_events_by_business(business['id'])
-                
-                context += f"- {business['name']}\n"
-                context += f"  Location: {business['location'] if not pd.isna(business['location']) else 'Unknown location'}\n"
-                context += f"  Description: {business['description'] if not pd.isna(business['description']) else 'No description available'}\n"
-                context += f"  Categories: {categories}\n"
-                
+            # Fill missing values once instead of per-cell pd.isna checks
+            businesses = businesses.fillna({
+                'location': 'Unknown location',
+                'description': 'No description available',
+                'categories': 'No categories'
+            })
+
+            # Fetch events for the whole batch in one query
+            business_ids = businesses['id'].tolist()
+            business_events = sql_db.get_events_for_businesses(business_ids)
+            if not business_events.empty:
+                business_events = business_events.fillna({'date': 'Date TBD', 'time': 'Time TBD'})
+                events_by_business = dict(tuple(business_events.groupby('business_id')))
+            else:
+                events_by_business = {}
+
+            lines.append("BUSINESSES:")
+
+            for business in businesses.itertuples():
+                lines.append(f"- {business.name}")
+                lines.append(f"  Location: {business.location}")
+                lines.append(f"  Description: {business.description}")
+                lines.append(f"  Categories: {business.categories}")
+
                 # Add events for this business
-                if not business_events.empty:
-                    context += f"  Events at this location:\n"
-                    for _, event in business_events.iterrows():
-                        event_date = event['date'] if not pd.isna(event['date']) else "Date TBD"
-                        event_time = event['time'] if not pd.isna(event['time']) else "Time TBD"
-                        context += f"  - {event['name']} on {event_date} at {event_time}\n"
-                
-                context += "\n"
-        
-        # Get matching events
-        events_query = user_message
-        date_filter = None
-        
-        # Handle date-specific queries
-        if has_time_reference:
-            today = datetime.datetime.now()
-            
-            if "today" in user_message.lower() or "tonight" in user_message.lower():
-                date_filter = today.strftime('%Y-%m-%d')
-                events_query = re.sub(r'today|tonight', '', user_message, flags=re.IGNORECASE).strip()
-            elif "tomorrow" in user_message.lower():
-                tomorrow = today + datetime.timedelta(days=1)
-                date_filter = tomorrow.strftime('%Y-%m-%d')
-                events_query = re.sub(r'tomorrow', '', user_message, flags=re.IGNORECASE).strip()
-            elif "this weekend" in user_message.lower() or "weekend" in user_message.lower():
-                # Find next Saturday
-                days_until_weekend = (5 - today.weekday()) % 7
-                if days_until_weekend == 0:  # If today is Saturday
-                    weekend_start = today
-                else:
-                    weekend_start = today + datetime.timedelta(days=days_until_weekend)
-                # Set date filter to weekend start
-                date_filter = weekend_start.strftime('%Y-%m-%d')
-                events_query = re.sub(r'this weekend|weekend', '', user_message, flags=re.IGNORECASE).strip()
-        
-        # Get events based on date filter or query
-        if date_filter:
-            events = sql_db.get_events_by_date(date_filter)
-            # If no events on exact date but we have a time reference, get all events
-            if events.empty and has_time_reference:
-                events = sql_db.search_events(events_query, limit=5)
-        else:
-            events = sql_db.search_events(events_query, limit=5)
+                events_here = events_by_business.get(business.id)
+                if events_here is not None:
+                    lines.append("  Events at this location:")
+                    for event in events_here.itertuples():
+                        lines.append(f"  - {event.name} on {event.date} at {event.time}")
+
+                lines.append("")
         
         if not events.empty:
-            context += "EVENTS:\n"
-            
-            for _, event in events.iterrows():
+            # Fill missing values once instead of per-cell pd.isna checks
+            events = events.fillna({
+                'date': 'Date TBD',
+                'time': 'Time TBD',
+                'location': 'Location TBD',
+                'description': 'No description available',
+                'url': 'No URL available'
+            })
+
+            lines.append("EVENTS:")
+
+            # One vectorized notna pass instead of a pd.isna call per row
+            has_venue_mask = events['business_id'].notna().to_numpy()
+
+            # Resolve all venues in one IN (...) query and index by id,
+            # instead of a get_business_by_id round trip per event
+            venue_ids = events['business_id'].dropna().astype(int).unique().tolist()
+            venues = sql_db.get_businesses_by_ids(venue_ids)
+            venues = venues.fillna({'location': 'location unknown'}).set_index('id')
+
+            for event, has_venue in zip(events.itertuples(), has_venue_mask):
                 venue_info = "No venue information"
-                has_venue = not pd.isna(event['business_id'])
-                
+
                 if has_venue:
-                    business = sql_db.get_business_by_id(int(event['business_id']))
-                    if business is not None:
-                        venue_info = f"{business['name']} ({business['location'] if not pd.isna(business['location']) else 'location unknown'})"
-                
-                context += f"- {event['name']}\n"
-                context += f"  Date: {event['date'] if not pd.isna(event['date']) else 'Date TBD'}\n"
-                context += f"  Time: {event['time'] if not pd.isna(event['time']) else 'Time TBD'}\n"
-                context += f"  Location: {event['location'] if not pd.isna(event['location']) else 'Location TBD'}\n"
-                context += f"  Venue: {venue_info}\n"
-                context += f"  Description: {event['description'] if not pd.isna(event['description']) else 'No description available'}\n"
-                context += f"  URL: {event['url'] if not pd.isna(event['url']) else 'No URL available'}\n"
-                context += "\n"
-    
+                    venue_id = int(event.business_id)
+                    if venue_id in venues.index:
+                        venue = venues.loc[venue_id]
+                        venue_info = f"{venue['name']} ({venue['location']})"
+
+                lines.append(f"- {event.name}")
+                lines.append(f"  Date: {event.date}")
+                lines.append(f"  Time: {event.time}")
+                lines.append(f"  Location: {event.location}")
+                lines.append(f"  Venue: {venue_info}")
+                lines.append(f"  Description: {event.description}")
+                lines.append(f"  URL: {event.url}")
+                lines.append("")
+
     # If we have no SQL results, try the vector database
-    if context == "" and (combined_db or vector_db or events_db):
-        vector_results = []
-        
+    if not lines and (combined_db or vector_db or events_db):
         if combined_db:
-            vector_matches = combined_db.similarity_search_with_relevance_scores(user_message, k=5)
-            
-            for doc, score in vector_matches:
+            vector_matches = cached_vector_search(user_message, k=5)
+
+            # Structure-of-arrays: parallel columns instead of a list of
+            # per-row dicts, so ranking and type partitioning below are
+            # single vectorized NumPy operations
+            types = []
+            names = []
+            locations = []
+            dates = []
+            times = []
+            descriptions = []
+            scores = np.empty(len(vector_matches), dtype=np.float32)
+
+            for i, (doc, score) in enumerate(vector_matches):
                 entity_type = doc.metadata.get('type', 'business')
-                
-                if entity_type == 'business':
-                    vector_results.append({
-                        'type': 'business',
-                        'name': doc.metadata.get('name', 'Unknown business'),
-                        'location': doc.metadata.get('location', 'Unknown location'),
-                        'description': doc.page_content if 'Description:' not in doc.page_content else doc.page_content.split('Description: ')[1].split('\n')[0],
-                        'score': score
-                    })
-                elif entity_type == 'event':
-                    vector_results.append({
-                        'type': 'event',
-                        'name': doc.metadata.get('name', 'Unknown event'),
-                        'date': doc.metadata.get('date', 'Date unknown'),
-                        'time': doc.metadata.get('time', 'Time unknown'),
-                        'location': doc.metadata.get('location', 'Location unknown'),
-                        'description': doc.page_content if 'Description:' not in doc.page_content else doc.page_content.split('Description: ')[1].split('\n')[0],
-                        'score': score
-                    })
-        
-        # Format vector results as context
-        if vector_results:
-            businesses = [r for r in vector_results if r['type'] == 'business']
-            events = [r for r in vector_results if r['type'] == 'event']
-            
-            if businesses:
-                context += "BUSINESSES (from vector search):\n"
-                for business in businesses:
-                    context += f"- {business['name']}\n"
-                    context += f"  Location: {business['location']}\n"
-                    context += f"  Description: {business['description']}\n\n"
-            
-            if events:
-                context += "EVENTS (from vector search):\n"
-                for event in events:
-                    context += f"- {event['name']}\n"
-                    context += f"  Date: {event['date']}\n"
-                    context += f"  Time: {event['time']}\n"
-                    context += f"  Location: {event['location']}\n"
-                    context += f"  Description: {event['description']}\n\n"
-    
-    return context
+                content = doc.page_content
+                description = (content.split('Description: ')[1].split('\n')[0]
+                               if 'Description:' in content else content)
+
+                types.append(entity_type)
+                names.append(doc.metadata.get('name', f'Unknown {entity_type}'))
+                locations.append(doc.metadata.get('location', 'Unknown location'))
+                dates.append(doc.metadata.get('date', 'Date unknown'))
+                times.append(doc.metadata.get('time', 'Time unknown'))
+                descriptions.append(description)
+                scores[i] = score
+
+            # Format vector results as context, best scores first per section
+            if names:
+                types_arr = np.array(types)
+                order = np.argsort(-scores)
+                business_idx = order[types_arr[order] == 'business']
+                event_idx = order[types_arr[order] == 'event']
+
+                if business_idx.size:
+                    lines.append("BUSINESSES (from vector search):")
+                    for i in business_idx:
+                        lines.append(f"- {names[i]}")
+                        lines.append(f"  Location: {locations[i]}")
+                        lines.append(f"  Description: {descriptions[i]}")
+                        lines.append("")
+
+                if event_idx.size:
+                    lines.append("EVENTS (from vector search):")
+                    for i in event_idx:
+                        lines.append(f"- {names[i]}")
+                        lines.append(f"  Date: {dates[i]}")
+                        lines.append(f"  Time: {times[i]}")
+                        lines.append(f"  Location: {locations[i]}")
+                        lines.append(f"  Description: {descriptions[i]}")
+                        lines.append("")
+
+    return "\n".join(lines)
 
 def contains_time_reference(query):
     """Check if the query contains time references like today, tonight, etc."""
-    time_keywords = [
-        'today', 'tonight', 'tomorrow', 'this weekend', 'weekend', 
-        'this week', 'next week', 'monday', 'tuesday', 'wednesday', 
-        'thursday', 'friday', 'saturday', 'sunday'
-    ]
-    
-    # Convert query to lowercase for case-insensitive matching
-    query_lower = query.lower()
-    
-    # Check for direct keyword matches
-    for keyword in time_keywords:
-        if keyword in query_lower:
-            return True
-    
-    # Check for date patterns (e.g., MM/DD, Month DD)
-    date_patterns = [
-        r'\d{1,2}/\d{1,2}',  # MM/DD
-        r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]* \d{1,2}'  # Month DD
-    ]
-    
-    for pattern in date_patterns:
-        if re.search(pattern, query_lower):
-            return True
-    
-    return False
+    return TIME_REFERENCE_RE.search(query) is not None
+
+# Categories rarely change, so cache the endpoint's result briefly
+_categories_cache = {'timestamp': 0.0, 'records': None}
+CATEGORIES_CACHE_TTL = 300  # seconds
 
 @app.route('/api/categories', methods=['GET'])
 def get_categories():
     """API endpoint to get all categories"""
     if sql_db is None:
         return jsonify({'error': 'SQL database not available'}), 500
-    
-    conn = sql_db.connect()
-    query = "SELECT * FROM categories"
-    df = pd.read_sql_query(query, conn)
-    conn.close()
-    
-    categories = df.to_dict('records')
-    return jsonify(categories)
+
+    now = time.time()
+    if _categories_cache['records'] is None or now - _categories_cache['timestamp'] > CATEGORIES_CACHE_TTL:
+        # Straight to dicts over the per-thread read connection; no pandas
+        _categories_cache['records'] = sql_db.execute_dicts("SELECT * FROM categories")
+        _categories_cache['timestamp'] = now
+
+    return jsonify(_categories_cache['records'])
+
+def _stream_records(rows):
+    """
+    Yield rows (dicts) as a JSON array one row at a time.
+
+    Rows are serialized with orjson as they stream out, so the response
+    starts immediately and peak memory stays flat no matter the limit,
+    instead of materializing the full JSON string up front.
+    """
+    yield b'['
+    for i, row in enumerate(rows):
+        if i:
+            yield b','
+        yield orjson.dumps(row)
+    yield b']'
 
 @app.route('/api/businesses', methods=['GET'])
 def get_businesses():
     """API endpoint to get businesses, with optional category filter"""
     if sql_db is None:
         return jsonify({'error': 'SQL database not available'}), 500
-    
+
     category = request.args.get('category', None)
     limit = int(request.args.get('limit', 10))
-    
+
     if category:
-        businesses = sql_db.get_businesses_by_category(category, limit=limit)
+        businesses = sql_db.execute_dicts("""
+        SELECT b.* FROM businesses b
+        JOIN business_categories bc ON b.id = bc.business_id
+        JOIN categories c ON bc.category_id = c.id
+        WHERE c.name LIKE ?
+        LIMIT ?
+        """, (f"%{category}%", limit))
     else:
-        businesses = sql_db.get_all_businesses().head(limit)
-    
-    return jsonify(businesses.to_dict('records'))
+        businesses = sql_db.execute_dicts("SELECT * FROM businesses LIMIT ?", (limit,))
+
+    return Response(stream_with_context(_stream_records(businesses)), mimetype='application/json')
 
 @app.route('/api/business/<int:business_id>', methods=['GET'])
 def get_business(business_id):
@@ -417,15 +836,17 @@ def get_events():
     limit = int(request.args.get('limit', 10))
     
     if date:
-        events = sql_db.get_events_by_date(date)
+        events = sql_db.execute_dicts("SELECT * FROM events WHERE date = ?", (date,))
     else:
-        events = sql_db.get_all_events().head(limit)
-    
-    return jsonify(events.to_dict('records'))
+        events = sql_db.execute_dicts("SELECT * FROM events LIMIT ?", (limit,))
+
+    return Response(stream_with_context(_stream_records(events)), mimetype='application/json')
+
+# Initialize the RAG system at import time so `gunicorn --preload` loads
+# the embedding model, Chroma index and Ollama client once in the master
+# process before forking workers
+init_rag_system()
 
 if __name__ == '__main__':
-    # Initialize the RAG system before starting the app
-    init_rag_system()
-    
-    # Start the Flask app
+    # Start the Flask dev server (use gunicorn.conf.py in production)
     app.run(debug=True, port=5001)
@@ -10,33 +10,16 @@ import os
 import sys
 import argparse
 import datetime
-import pandas as pd
-from typing import List, Dict, Optional
-
-# Try to import dependencies
-try:
-    import tkinter as tk
-    import numpy as np
-    import matplotlib.pyplot as plt
-    from utils.database_manager import CharlestonDB
-    
-    # Import scrapers
-    from data_collection.scrapers import BaseEventScraper
-    from data_collection.sources.open_data_scraper import OpenDataScraper
-    from data_collection.sources.lowcountry_local_first import LowcountryLocalFirstScraper
-    # Only import the selenium scraper - comment out the others that don't exist
-    # from data_collection.sources.holy_city_sinner import HolyCitySinnerScraper
-    # from data_collection.sources.city_paper_scraper import CityScraper
-    # from data_collection.sources.charleston_wine_food import CharlestonWineFoodScraper
-    from data_collection.sources.lowcountry_local_first_selenium import LowcountryLocalFirstSeleniumScraper
-except ImportError as e:
-    print(f"Error importing modules: {e}")
-    print("Make sure you're running this script from the project root directory.")
-    sys.exit(1)
+
+# Heavy dependencies (pandas, the database layer, the scrapers and their
+# Selenium stack) are imported inside the command handlers that need them,
+# so every CLI invocation doesn't pay their import cost up front.
 
 
 def init_db(args):
     """Initialize the database"""
+    from utils.database_manager import CharlestonDB
+
     db = CharlestonDB()
     
     # Check if we need to initialize
@@ -111,6 +94,9 @@ def update_vectors(args):
 
 def list_events(args):
     """List events from the database"""
+    import pandas as pd
+    from utils.database_manager import CharlestonDB
+
     db = CharlestonDB()
     
     print("Listing events from database...")
@@ -130,12 +116,17 @@ def list_events(args):
     if events.empty:
         print("No events found.")
     else:
-        for _, event in events.iterrows():
-            date = event['date'] if not pd.isna(event['date']) else "Date unknown"
-            time = event['time'] if not pd.isna(event['time']) else "Time unknown"
-            location = event['location'] if not pd.isna(event['location']) else "Location unknown"
-            
-            print(f"- {event['name']}")
+        # zip over column arrays instead of iterrows(), which builds a
+        # throwaway Series for every row
+        for name, date, time, location in zip(
+            events['name'].to_numpy(), events['date'].to_numpy(),
+            events['time'].to_numpy(), events['location'].to_numpy()
+        ):
+            date = date if not pd.isna(date) else "Date unknown"
+            time = time if not pd.isna(time) else "Time unknown"
+            location = location if not pd.isna(location) else "Location unknown"
+
+            print(f"- {name}")
             print(f"  Date: {date}")
             print(f"  Time: {time}")
             print(f"  Location: {location}")
@@ -144,121 +135,24 @@ def list_events(args):
 
 def create_venue_connections(args):
     """Create connections between events and businesses based on venue information"""
-    print("Creating connections between events and businesses...")
-    
-    # Get the project root directory
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    
-    # Check if the necessary files exist
-    business_csv = os.path.join(project_root, 'data/charleston_businesses.csv')
-    events_csv = os.path.join(project_root, 'data/charleston_events.csv')
-    
-    if not os.path.exists(business_csv):
-        print(f"Business data file not found at {business_csv}")
-        return False
-        
-    if not os.path.exists(events_csv):
-        print(f"Events data file not found at {events_csv}")
-        return False
-    
-    # Load the data
-    businesses_df = pd.read_csv(business_csv)
-    events_df = pd.read_csv(events_csv)
-    
-    print(f"Loaded {len(businesses_df)} businesses and {len(events_df)} events")
-    
-    # Import the necessary module for fuzzy matching
-    try:
-        from thefuzz import fuzz, process
-    except ImportError:
-        print("thefuzz module not found. Please install it with 'pip install thefuzz'")
+    # Delegate to the shared implementation so the matching logic lives in
+    # one place (utils/create_venue_connections.py)
+    from utils.create_venue_connections import create_venue_connections as build_connections
+
+    result = build_connections()
+    if result is None:
         return False
-    
-    import re
-    
-    # Create lists of business names and locations for matching
-    business_names = businesses_df['Name'].tolist()
-    business_locations = businesses_df['Location'].tolist()
-    
-    # Clean business names for better matching
-    clean_business_names = [
-        re.sub(r'[^\w\s]', '', name).lower() for name in business_names
-    ]
-    
-    # Add a business_id column to the events DataFrame
-    events_df['Business_ID'] = None
-    events_df['Business_Match_Type'] = None
-    events_df['Business_Match_Score'] = None
-    
-    # Process each event
-    for i, event in events_df.iterrows():
-        location = str(event['Location']) if not pd.isna(event['Location']) else ""
-        event_name = str(event['Name']) if not pd.isna(event['Name']) else ""
-        
-        # Skip if no location information
-        if not location:
-            continue
-            
-        # Clean the location string for better matching
-        clean_location = re.sub(r'[^\w\s]', '', location).lower()
-        
-        # Check for explicit venue mentions first
-        best_match = None
-        best_score = 0
-        match_type = None
-        match_index = -1
-        
-        # Try to match on business name in the location field
-        for j, business_name in enumerate(clean_business_names):
-            if business_name and len(business_name) > 3:  # Avoid matching very short names
-                score = fuzz.partial_ratio(clean_location, business_name)
-                if score > 80 and score > best_score:  # Threshold of 80% match
-                    best_score = score
-                    best_match = business_names[j]
-                    match_type = "location_to_name"
-                    match_index = j
-        
-        # If no match found yet, try matching on business location
-        if not best_match:
-            for j, business_loc in enumerate(business_locations):
-                if business_loc and not pd.isna(business_loc):
-                    clean_business_loc = re.sub(r'[^\w\s]', '', str(business_loc)).lower()
-                    score = fuzz.partial_ratio(clean_location, clean_business_loc)
-                    if score > 80 and score > best_score:
-                        best_score = score
-                        best_match = business_names[j]
-                        match_type = "location_to_location"
-                        match_index = j
-        
-        # If still no match, check if the event name contains a business name
-        if not best_match:
-            clean_event_name = re.sub(r'[^\w\s]', '', event_name).lower()
-            for j, business_name in enumerate(clean_business_names):
-                if business_name and len(business_name) > 3:
-                    score = fuzz.partial_ratio(clean_event_name, business_name)
-                    if score > 85 and score > best_score:  # Higher threshold for name matches
-                        best_score = score
-                        best_match = business_names[j]
-                        match_type = "name_to_name"
-                        match_index = j
-        
-        # Record the match information if found
-        if best_match and match_index >= 0:
-            events_df.at[i, 'Business_ID'] = businesses_df.iloc[match_index].name
-            events_df.at[i, 'Business_Match_Type'] = match_type
-            events_df.at[i, 'Business_Match_Score'] = best_score
-    
-    # Save the enhanced events data
-    print(f"Found business connections for {events_df['Business_ID'].notna().sum()} events")
-    connections_csv = os.path.join(project_root, 'data/charleston_event_connections.csv')
-    events_df.to_csv(connections_csv, index=False)
-    print(f"Saved event-business connections to {connections_csv}")
-    
+
     # Update the vector database if requested
     if args.update_vectors:
         print("Updating vector database with business connections...")
+        try:
+            from utils.build_vector_db import merge_databases
+        except ImportError as e:
+            print(f"Error importing vector database utilities: {e}")
+            return False
         merge_databases()
-    
+
     return True
 
 
@@ -301,6 +195,9 @@ def build_vectors(args):
 
 def scrape_businesses(args):
     """Scrape businesses from Yelp API"""
+    from utils.database_manager import CharlestonDB
+    from data_collection.sources.yelp_businesses import YelpBusinessScraper
+
     # Check if API key is provided or in environment
     api_key = args.api_key or os.environ.get('YELP_API_KEY')
     if not api_key:
@@ -356,6 +253,9 @@ def scrape_businesses(args):
 
 def scrape_open_data(args):
     """Scrape data from Charleston Open Data Portal"""
+    from utils.database_manager import CharlestonDB
+    from data_collection.sources.open_data_scraper import OpenDataScraper
+
     db = CharlestonDB() if args.save_to_db else None
     
     print("Scraping data from Charleston Open Data Portal...")
@@ -399,6 +299,8 @@ def scrape_open_data(args):
 
 def migrate_to_places(args):
     """Migrate business data to the places table"""
+    from utils.database_manager import CharlestonDB
+
     db = CharlestonDB()
     
     # Check if there are businesses to migrate
@@ -446,6 +348,9 @@ def migrate_to_places(args):
 
 def scrape_lowcountry(args):
     """Scrape businesses from Lowcountry Local First directory"""
+    from utils.database_manager import CharlestonDB
+    from data_collection.sources.lowcountry_local_first import LowcountryLocalFirstScraper
+
     db = CharlestonDB() if args.save_to_db else None
     
     print("Scraping businesses from Lowcountry Local First directory...")
@@ -487,9 +392,12 @@ def scrape_lowcountry(args):
 
 
 def scrape_lowcountry_selenium(args):
+    from data_collection.sources.lowcountry_local_first_selenium import LowcountryLocalFirstSeleniumScraper
+
     # Check if we should save to database
     db_connection = None
     if args.save_to_db:
+        from utils.database_manager import CharlestonDB
         chs_db = CharlestonDB()
         db_connection = chs_db.connection
         
@@ -575,12 +483,14 @@ Examples:
     
     # Initialize database command
     init_parser = subparsers.add_parser('init-db', help='Initialize the database')
+    init_parser.set_defaults(func=init_db)
     init_parser.add_argument('--force', action='store_true', help='Force reinitialization even if database exists')
     init_parser.add_argument('--skip-businesses', action='store_true', help='Skip business import and focus on events')
     init_parser.add_argument('--scrape-events', action='store_true', help='Scrape events after initializing database')
     
     # Scrape events command
     scrape_parser = subparsers.add_parser('scrape-events', help='Scrape events from sources')
+    scrape_parser.set_defaults(func=scrape_events)
     scrape_parser.add_argument('--source', help='Source to scrape (default: all)')
     scrape_parser.add_argument('--start-date', help='Start date (YYYY-MM-DD)')
     scrape_parser.add_argument('--end-date', help='End date (YYYY-MM-DD)')
@@ -588,21 +498,25 @@ Examples:
     
     # List events command
     list_parser = subparsers.add_parser('list-events', help='List events from the database')
+    list_parser.set_defaults(func=list_events)
     list_parser.add_argument('--date', help='Show events for a specific date (YYYY-MM-DD)')
     list_parser.add_argument('--query', help='Search for events matching a keyword')
     list_parser.add_argument('--limit', type=int, default=10, help='Maximum number of events to list')
     
     # Create venue connections command
     connections_parser = subparsers.add_parser('create-connections', help='Create connections between events and businesses')
+    connections_parser.set_defaults(func=create_venue_connections)
     connections_parser.add_argument('--update-vectors', action='store_true', help='Update vector database with the connections')
     
     # Build vector database command
     vectors_parser = subparsers.add_parser('build-vectors', help='Build or update vector databases')
+    vectors_parser.set_defaults(func=build_vectors)
     vectors_parser.add_argument('--type', choices=['business', 'events', 'places', 'combined', 'all'], 
                          default='all', help='Type of vector database to build')
     
     # Scrape businesses command
     businesses_parser = subparsers.add_parser('scrape-businesses', help='Scrape businesses from Yelp API')
+    businesses_parser.set_defaults(func=scrape_businesses)
     businesses_parser.add_argument('--api-key', help='Yelp API key')
     businesses_parser.add_argument('--categories', help='Comma-separated list of categories to scrape')
     businesses_parser.add_argument('--limit', type=int, help='Maximum number of businesses to scrape per category')
@@ -611,17 +525,20 @@ Examples:
     
     # Scrape open data command
     opendata_parser = subparsers.add_parser('scrape-open-data', help='Scrape data from Charleston Open Data Portal')
+    opendata_parser.set_defaults(func=scrape_open_data)
     opendata_parser.add_argument('--datasets', help='Comma-separated list of datasets to scrape (default: all)')
     opendata_parser.add_argument('--output-dir', help='Directory to save CSV files')
     opendata_parser.add_argument('--save-to-db', action='store_true', help='Save data to database')
     
     # Migrate to places command
     migrate_parser = subparsers.add_parser('migrate-to-places', help='Migrate business data to places table')
+    migrate_parser.set_defaults(func=migrate_to_places)
     migrate_parser.add_argument('--force', action='store_true', help='Skip confirmation prompt')
     migrate_parser.add_argument('--clear-businesses', action='store_true', help='Clear businesses table after migration')
     
     # Scrape Lowcountry Local First command
     lowcountry_parser = subparsers.add_parser('scrape-lowcountry', help='Scrape businesses from Lowcountry Local First directory')
+    lowcountry_parser.set_defaults(func=scrape_lowcountry)
     lowcountry_parser.add_argument('--categories', help='Comma-separated list of categories to scrape (default: all)')
     lowcountry_parser.add_argument('--limit', type=int, help='Maximum number of businesses to scrape')
     lowcountry_parser.add_argument('--output', help='Output CSV file for businesses')
@@ -650,6 +567,7 @@ Examples:
         action='store_true',
         help='Save businesses to database'
     )
+    parser_scrape_lowcountry_selenium.set_defaults(func=scrape_lowcountry_selenium)
     
     args = parser.parse_args()
     
@@ -657,29 +575,8 @@ Examples:
         parser.print_help()
         return
     
-    # Execute the appropriate command
-    if args.command == 'init-db':
-        init_db(args)
-    elif args.command == 'scrape-events':
-        scrape_events(args)
-    elif args.command == 'list-events':
-        list_events(args)
-    elif args.command == 'create-connections':
-        create_venue_connections(args)
-    elif args.command == 'build-vectors':
-        build_vectors(args)
-    elif args.command == 'scrape-businesses':
-        scrape_businesses(args)
-    elif args.command == 'scrape-open-data':
-        scrape_open_data(args)
-    elif args.command == 'migrate-to-places':
-        migrate_to_places(args)
-    elif args.command == 'scrape-lowcountry':
-        scrape_lowcountry(args)
-    elif args.command == 'scrape-lowcountry-selenium':
-        scrape_lowcountry_selenium(args)
-    else:
-        parser.print_help()
+    # Each subparser binds its handler via set_defaults(func=...)
+    args.func(args)
 
 
 if __name__ == "__main__":
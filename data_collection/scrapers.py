@@ -7,13 +7,25 @@ for managing and running scrapers.
 
 import os
 import sys
-import inspect
+import pkgutil
 import importlib
-import importlib.util
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional, Any, Union
 
 
+# Scraper classes register themselves here at import time via the
+# register_scraper decorator; discovery then just imports the source
+# modules and reads the dict instead of introspecting every symbol
+_REGISTRY: Dict[str, type] = {}
+
+
+def register_scraper(cls):
+    """Class decorator that makes a scraper visible to discover_scrapers"""
+    _REGISTRY[cls.__name__] = cls
+    return cls
+
+
 class BaseEventScraper(ABC):
     """Base class for all event scrapers"""
     
@@ -37,25 +49,71 @@ class BaseEventScraper(ABC):
         """Scrape details for a single event"""
         pass
         
-    def scrape_events(self, start_date=None, end_date=None, days=30) -> List[Dict[str, Any]]:
-        """Scrape all events in a date range"""
+    def _iter_events(self, start_date=None, end_date=None, days=30):
+        """Yield scraped events one at a time as their pages come back"""
         event_urls = self.get_events_for_date_range(start_date, end_date, days)
         print(f"Found {len(event_urls)} event URLs to scrape")
         
-        events = []
         for url in event_urls:
             event_data = self.scrape_event(url)
             if event_data:
-                events.append(event_data)
-        
+                yield event_data
+    
+    def scrape_events(self, start_date=None, end_date=None, days=30) -> List[Dict[str, Any]]:
+        """Scrape all events in a date range"""
+        events = list(self._iter_events(start_date, end_date, days))
         print(f"Successfully scraped {len(events)} events")
         return events
+    
+    def save_stream(self, events_iter, batch_size=500) -> int:
+        """
+        Persist events while they are still being scraped.
+        
+        Pulls from the iterator and flushes every batch_size events, so
+        DB inserts of one batch overlap the HTTP fetches of the next and
+        the full event list never has to sit in memory. Returns the
+        number of events saved.
+        """
+        if not self.db_connection:
+            print("No database connection provided, can't save events")
+            return 0
+        
+        total = 0
+        batch = []
+        for event in events_iter:
+            batch.append(event)
+            if len(batch) >= batch_size:
+                total += self.save_to_database(batch)
+                batch = []
+        if batch:
+            total += self.save_to_database(batch)
+        return total
         
     def save_to_database(self, events: List[Dict[str, Any]]) -> int:
         """Save events to the database"""
         if not self.db_connection:
             print("No database connection provided, can't save events")
             return 0
+        
+        # Prefer the bulk path: one executemany in a single transaction
+        # instead of a connect/insert/commit cycle per event
+        if hasattr(self.db_connection, 'add_events_bulk'):
+            try:
+                rows = [(
+                    event.get('Name', event.get('name')),
+                    event.get('Date', event.get('date')),
+                    event.get('Time', event.get('time')),
+                    event.get('Location', event.get('location')),
+                    event.get('Description', event.get('description')),
+                    event.get('URL', event.get('url')),
+                    event.get('Image_URL', event.get('image_url')),
+                    event.get('Source', event.get('source', self.source_name)),
+                    event.get('Business_ID', event.get('business_id'))
+                ) for event in events]
+                return self.db_connection.add_events_bulk(rows)
+            except Exception as e:
+                print(f"Error bulk-saving events to database: {e}")
+                return 0
             
         count = 0
         for event in events:
@@ -92,8 +150,18 @@ class BaseEventScraper(ABC):
         return count
 
 
+# Discovery walks the sources directory and executes every module in it,
+# which is far too expensive to repeat for each helper call, so the
+# result is cached for the life of the process
+_DISCOVERED_SCRAPERS: Optional[Dict[str, type]] = None
+
+
 def discover_scrapers() -> Dict[str, type]:
-    """Discover all available scraper classes"""
+    """Discover all available scraper classes (cached after the first call)"""
+    global _DISCOVERED_SCRAPERS
+    if _DISCOVERED_SCRAPERS is not None:
+        return _DISCOVERED_SCRAPERS
+    
     scrapers = {}
     
     # Get the directory with source modules
@@ -102,30 +170,28 @@ def discover_scrapers() -> Dict[str, type]:
         print(f"Error: Sources directory not found at {sources_dir}")
         return scrapers
     
-    # Discover Python modules in the sources directory
-    for filename in os.listdir(sources_dir):
-        if filename.endswith('.py') and not filename.startswith('__'):
-            module_name = filename[:-3]  # Remove .py extension
-            module_path = os.path.join(sources_dir, filename)
-            
-            try:
-                # Import the module
-                spec = importlib.util.spec_from_file_location(f"data_collection.sources.{module_name}", module_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                
-                # Find scraper classes in the module
-                for name, obj in inspect.getmembers(module):
-                    if (inspect.isclass(obj) and 
-                        issubclass(obj, BaseEventScraper) and 
-                        obj is not BaseEventScraper):
-                        scrapers[name] = obj
-            except Exception as e:
-                print(f"Error loading scraper module {module_name}: {e}")
+    # Import each source module through the regular import machinery so
+    # sys.modules deduplicates modules that are also imported elsewhere;
+    # each import runs the register_scraper decorators in that module
+    for module_info in pkgutil.iter_modules([sources_dir]):
+        if module_info.name.startswith('__'):
+            continue
+        try:
+            importlib.import_module(f"data_collection.sources.{module_info.name}")
+        except Exception as e:
+            print(f"Error loading scraper module {module_info.name}: {e}")
     
+    scrapers = dict(_REGISTRY)
+    _DISCOVERED_SCRAPERS = scrapers
     return scrapers
 
 
+def invalidate_scraper_cache():
+    """Force the next discover_scrapers call to rescan the sources directory"""
+    global _DISCOVERED_SCRAPERS
+    _DISCOVERED_SCRAPERS = None
+
+
 def get_available_scrapers() -> Dict[str, type]:
     """Get all available scrapers"""
     return discover_scrapers()
@@ -148,39 +214,72 @@ def run_scraper(scraper_name: str, db_connection=None, start_date=None, end_date
     if not scraper:
         return []
         
-    # Scrape events
-    events = scraper.scrape_events(start_date, end_date, days)
-    
-    # Save to database if requested
+    # When saving, stream events into the database as they arrive so
+    # scraping and DB inserts overlap
     if save_to_db and db_connection:
-        saved = scraper.save_to_database(events)
+        events = []
+        
+        def _collect():
+            for event in scraper._iter_events(start_date, end_date, days):
+                events.append(event)
+                yield event
+        
+        saved = scraper.save_stream(_collect())
+        print(f"Successfully scraped {len(events)} events")
         print(f"Saved {saved} events to database")
+        return events
+    
+    return scraper.scrape_events(start_date, end_date, days)
+
+
+def _run_one_scraper(name, scraper_class, db_connection, start_date, end_date, days, save_to_db):
+    """Instantiate and run a single scraper (worker for run_all_scrapers)"""
+    print(f"Running scraper: {name}")
+    scraper = scraper_class(db_connection)
+    
+    # When saving, stream events into the database as they arrive so
+    # scraping and DB inserts overlap. CharlestonDB opens a fresh
+    # connection per call, so concurrent saves from worker threads are safe.
+    if save_to_db and db_connection:
+        events = []
+        
+        def _collect():
+            for event in scraper._iter_events(start_date, end_date, days):
+                events.append(event)
+                yield event
         
-    return events
+        saved = scraper.save_stream(_collect())
+        print(f"Successfully scraped {len(events)} events")
+        print(f"Saved {saved} events to database")
+        return events
+    
+    return scraper.scrape_events(start_date, end_date, days)
 
 
 def run_all_scrapers(db_connection=None, start_date=None, end_date=None, days=30, save_to_db=True) -> Dict[str, List[Dict[str, Any]]]:
-    """Run all available scrapers"""
+    """Run all available scrapers concurrently"""
     scrapers = discover_scrapers()
     results = {}
+    if not scrapers:
+        return results
     
-    for name, scraper_class in scrapers.items():
-        print(f"Running scraper: {name}")
-        try:
-            # Instantiate the scraper
-            scraper = scraper_class(db_connection)
-            
-            # Scrape events
-            events = scraper.scrape_events(start_date, end_date, days)
-            
-            # Save to database if requested
-            if save_to_db and db_connection:
-                saved = scraper.save_to_database(events)
-                print(f"Saved {saved} events to database")
-                
-            results[name] = events
-        except Exception as e:
-            print(f"Error running scraper {name}: {e}")
-            results[name] = []
+    # Each scraper spends nearly all its time waiting on HTTP, so running
+    # them in a thread pool makes total wall clock roughly the slowest
+    # source instead of the sum of all of them
+    with ThreadPoolExecutor(max_workers=min(8, len(scrapers))) as executor:
+        futures = {
+            executor.submit(
+                _run_one_scraper, name, scraper_class, db_connection,
+                start_date, end_date, days, save_to_db
+            ): name
+            for name, scraper_class in scrapers.items()
+        }
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                print(f"Error running scraper {name}: {e}")
+                results[name] = []
     
     return results 
\ No newline at end of file
@@ -1,13 +1,17 @@
+import os
 import time
 from selenium import webdriver
-from selenium.webdriver.safari.options import Options
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.safari.options import Options as SafariOptions
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-from .scrapers import BaseEventScraper
+from .scrapers import BaseEventScraper, register_scraper
 
+@register_scraper
 class BaseSeleniumScraper(BaseEventScraper):
     """Base class for all Selenium-based scrapers."""
     
@@ -34,11 +38,33 @@ class BaseSeleniumScraper(BaseEventScraper):
         return None
         
     def _initialize_driver(self):
-        """Initialize the Safari WebDriver."""
-        options = Options()
-        self.driver = webdriver.Safari(options=options)
-        # Set default wait time
-        self.driver.implicitly_wait(10)
+        """Initialize the WebDriver.
+        
+        Defaults to headless Chrome (fast startup, no GUI, images
+        disabled, supports concurrent instances); set SELENIUM_BROWSER to
+        "safari" or "firefox" to override for local development.
+        """
+        browser = os.environ.get('SELENIUM_BROWSER', 'chrome').lower()
+        if browser == 'safari':
+            # Safari has no headless mode and allows only one WebDriver
+            # instance per host
+            self.driver = webdriver.Safari(options=SafariOptions())
+        elif browser == 'firefox':
+            options = FirefoxOptions()
+            options.add_argument('-headless')
+            self.driver = webdriver.Firefox(options=options)
+        else:
+            options = ChromeOptions()
+            for arg in (
+                '--headless=new',
+                '--disable-gpu',
+                '--no-sandbox',
+                '--disable-dev-shm-usage',
+                '--blink-settings=imagesEnabled=false',
+                '--disable-extensions',
+            ):
+                options.add_argument(arg)
+            self.driver = webdriver.Chrome(options=options)
         
     def _close_driver(self):
         """Close the WebDriver."""
@@ -46,12 +72,14 @@ class BaseSeleniumScraper(BaseEventScraper):
             self.driver.quit()
             self.driver = None
             
-    def get_page(self, url, wait_time=10):
+    def get_page(self, url, wait_time=10, ready_selector=None):
         """Load a page in the browser.
         
         Args:
             url: The URL to load.
-            wait_time: Time to wait for the page to load in seconds.
+            wait_time: Maximum time to wait for the page to load in seconds.
+            ready_selector: Optional CSS selector whose presence marks the
+                page as ready; if omitted, waits for document.readyState.
             
         Returns:
             The driver instance after loading the page.
@@ -60,8 +88,19 @@ class BaseSeleniumScraper(BaseEventScraper):
             self._initialize_driver()
             
         self.driver.get(url)
-        # Give the page some time to load
-        time.sleep(wait_time)
+        # Wait for actual readiness instead of sleeping the full
+        # wait_time; pages typically become interactive in a fraction of it
+        try:
+            if ready_selector:
+                WebDriverWait(self.driver, wait_time).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, ready_selector))
+                )
+            else:
+                WebDriverWait(self.driver, wait_time).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete"
+                )
+        except TimeoutException:
+            print(f"Timed out waiting for page to load: {url}")
         return self.driver
     
     def wait_for_element(self, selector, by=By.CSS_SELECTOR, timeout=10):
@@ -118,30 +157,41 @@ class BaseSeleniumScraper(BaseEventScraper):
         """Scroll to the bottom of the page to load lazy-loaded content.
         
         Args:
-            scroll_pause_time: Time to pause between scrolls in seconds.
+            scroll_pause_time: Maximum pause between scrolls in seconds.
             max_scrolls: Maximum number of scrolls to perform.
             
         Returns:
             True if scrolled to bottom, False otherwise.
         """
+        # One script both scrolls and reports the new height, halving the
+        # browser round-trips per iteration
+        scroll_js = (
+            "window.scrollTo(0, document.body.scrollHeight);"
+            "return document.body.scrollHeight;"
+        )
         last_height = self.driver.execute_script("return document.body.scrollHeight")
-        
+
+        # Poll in short steps instead of always sleeping the full pause;
+        # pages that load their lazy content quickly stop costing
+        # scroll_pause_time per scroll
+        poll = min(0.2, scroll_pause_time)
         for _ in range(max_scrolls):
-            # Scroll down
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            
-            # Wait for content to load
-            time.sleep(scroll_pause_time)
-            
-            # Calculate new scroll height and compare with last scroll height
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            
+            new_height = self.driver.execute_script(scroll_js)
+
+            # The height measured right after the scroll doesn't reflect
+            # content that is still loading, so give the page up to
+            # scroll_pause_time to grow before concluding we're at the bottom
+            deadline = time.monotonic() + scroll_pause_time
+            while new_height == last_height and time.monotonic() < deadline:
+                time.sleep(poll)
+                new_height = self.driver.execute_script("return document.body.scrollHeight")
+
             if new_height == last_height:
                 # We've reached the bottom
                 return True
-            
+
             last_height = new_height
-        
+
         # We've reached max_scrolls but might not be at the bottom
         return False
         
@@ -7,13 +7,19 @@ This module implements a scraper for Charleston CVB events.
 import re
 import time
 import random
+import asyncio
 import datetime
+import aiohttp
 import requests
-from bs4 import BeautifulSoup
+from dateutil import parser as dateparser
+from urllib.parse import urljoin, urlsplit, urlunsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import List, Dict, Optional, Any, Union
 
 # Import from parent package
-from data_collection.scrapers import BaseEventScraper
+from data_collection.scrapers import BaseEventScraper, register_scraper
 from data_collection.utils import (
     clean_text,
     get_soup,
@@ -21,9 +27,69 @@ from data_collection.utils import (
 )
 
 
+# Upper bound on in-flight event-page fetches; the scraping workload is
+# dominated by HTTP round-trips, so this is the effective speedup factor
+MAX_CONCURRENT_FETCHES = 20
+
+# Never download or parse more than this many bytes of one page; event
+# pages are well under this, so anything larger is boilerplate or abuse
+MAX_PAGE_BYTES = 5_000_000
+
+# Date/time patterns compiled once instead of per event page. The date
+# patterns only locate a date-bearing substring; dateutil does the parsing
+_DATE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    # Month name followed by day and optional year
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?',
+    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?',
+    # MM/DD/YYYY
+    r'(\d{1,2})/(\d{1,2})/(\d{4})',
+    # YYYY-MM-DD
+    r'(\d{4})-(\d{1,2})-(\d{1,2})'
+)]
+# Images whose src matches this are chrome, not content
+_BAD_IMG_RE = re.compile(r'(?:logo|icon|sprite|favicon|placeholder)', re.IGNORECASE)
+
+# Only these tags are ever queried when parsing an event page; straining
+# the parse to them skips DOM construction for everything else
+_EVENT_STRAINER = SoupStrainer(
+    ['h1', 'title', 'p', 'img', 'address', 'a', 'div', 'section', 'article', 'time']
+)
+
+_TIME_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(\d{1,2}:\d{2}\s*[ap]m)',
+    r'(\d{1,2}\s*[ap]m)',
+    r'(?:at|from|starting at)\s+(\d{1,2}(?::\d{2})?\s*[ap]m)'
+)]
+
+
+def _parse_date_text(text):
+    """Parse a date snippet into YYYY-MM-DD, or '' if unparseable"""
+    if not text:
+        return ''
+    try:
+        parsed = dateparser.parse(
+            text, fuzzy=True,
+            default=datetime.datetime(datetime.datetime.now().year, 1, 1)
+        )
+        return parsed.strftime('%Y-%m-%d')
+    except (ValueError, OverflowError):
+        return ''
+
+
+@register_scraper
 class CharlestonCVBScraper(BaseEventScraper):
     """Scraper for Charleston CVB events"""
     
+    # Fused fallback selectors per field, built once at class load; each
+    # resolves its whole fallback chain in one select_one call
+    _NAME_SEL = '.detail-header__title, h1, .event-title, .title'
+    _DESC_SEL = '.detail-tabs__content, .event-description, .description, article p'
+    _LOC_SEL = '.detail-top__address, .event-location, .location, address'
+    _VENUE_SEL = '.detail-header__subtitle a, .venue-name, .location-name'
+    _DATE_SEL = '.detail-top__date, .event-date, .date, time'
+    _TIME_SEL = '.detail-top__time, .event-time, .time'
+    _IMG_SEL = '.detail-image img[src], .event-image img[src], img.event[src], .featured-image img[src]'
+    
     def __init__(self, db_connection=None):
         """Initialize the scraper"""
         super().__init__(db_connection)
@@ -31,6 +97,21 @@ class CharlestonCVBScraper(BaseEventScraper):
         self.search_url = "https://www.charlestoncvb.com/events/search.php"
         self.headers = get_headers()
         
+        # One pooled session for all synchronous requests to the CVB
+        # host: connections (and their TLS handshakes) are reused across
+        # calls, and transient errors get a jittered retry
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=20, pool_maxsize=20,
+            max_retries=Retry(
+                total=3, backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504]
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
     @property
     def source_name(self) -> str:
         """Return the name of this data source"""
@@ -57,7 +138,7 @@ class CharlestonCVBScraper(BaseEventScraper):
         
         # Make the search request
         try:
-            response = requests.post(self.search_url, data=form_data, headers=self.headers)
+            response = self.session.post(self.search_url, data=form_data, timeout=(3, 10))
             
             if response.status_code != 200:
                 print(f"Error fetching events: {response.status_code}")
@@ -66,6 +147,7 @@ class CharlestonCVBScraper(BaseEventScraper):
             # Parse the search results
             soup = BeautifulSoup(response.text, 'html.parser')
             event_links = []
+            seen = set()  # canonical-form set keeps dedup O(1) per link
             
             # Find event links - they are in listing-card__title-link classes
             for link in soup.select('.listing-card__title-link'):
@@ -73,7 +155,10 @@ class CharlestonCVBScraper(BaseEventScraper):
                 if event_url and '/events/' in event_url:
                     # Make the URL absolute if it's relative
                     event_url = self._make_absolute_url(event_url)
-                    event_links.append(event_url)
+                    key = self._canon(event_url)
+                    if key not in seen:
+                        seen.add(key)
+                        event_links.append(event_url)
             
             print(f"Found {len(event_links)} events")
             
@@ -81,7 +166,7 @@ class CharlestonCVBScraper(BaseEventScraper):
             if len(event_links) == 0:
                 print("Trying alternate event search approach...")
                 # Try browsing directly to the events page
-                response = requests.get(self.base_url, headers=self.headers)
+                response = self.session.get(self.base_url, timeout=(3, 10))
                 if response.status_code == 200:
                     soup = BeautifulSoup(response.text, 'html.parser')
                     
@@ -91,20 +176,15 @@ class CharlestonCVBScraper(BaseEventScraper):
                         if href and '/events/' in href and 'search.php' not in href:
                             # Make the URL absolute if it's relative
                             href = self._make_absolute_url(href)
-                            if href not in event_links:
+                            key = self._canon(href)
+                            if key not in seen:
+                                seen.add(key)
                                 event_links.append(href)
                     
                     print(f"Found {len(event_links)} events using alternate method")
             
-            # Scrape each event
-            event_data = []
-            for url in event_links:
-                # Add delay to avoid being blocked
-                time.sleep(random.uniform(1.0, 3.0))
-                
-                event = self.scrape_event(url)
-                if event:
-                    event_data.append(event)
+            # Scrape the event pages concurrently
+            event_data = asyncio.run(self._scrape_all(event_links))
             
             print(f"Successfully scraped {len(event_data)} CVB events")
             return event_data
@@ -122,9 +202,10 @@ class CharlestonCVBScraper(BaseEventScraper):
             ]
             
             event_links = []
+            seen = set()
             for url in fallback_urls:
                 try:
-                    response = requests.get(url, headers=self.headers)
+                    response = self.session.get(url, timeout=(3, 10))
                     if response.status_code == 200:
                         soup = BeautifulSoup(response.text, 'html.parser')
                         for link in soup.select('a'):
@@ -132,47 +213,130 @@ class CharlestonCVBScraper(BaseEventScraper):
                             if href and '/events/' in href and 'search.php' not in href:
                                 # Make the URL absolute if it's relative
                                 href = self._make_absolute_url(href)
-                                if href not in event_links:
+                                key = self._canon(href)
+                                if key not in seen:
+                                    seen.add(key)
                                     event_links.append(href)
                 except Exception as inner_e:
                     print(f"Error with fallback URL {url}: {inner_e}")
             
             print(f"Found {len(event_links)} events using fallback method")
             
-            # Scrape each event
-            event_data = []
-            for url in event_links:
-                # Add delay to avoid being blocked
-                time.sleep(random.uniform(1.0, 3.0))
-                
-                event = self.scrape_event(url)
-                if event:
-                    event_data.append(event)
-            
-            return event_data
+            # Scrape the event pages concurrently
+            return asyncio.run(self._scrape_all(event_links))
+    
+    async def _fetch(self, session, url, semaphore):
+        """Fetch a single event page, bounded by the shared semaphore"""
+        async with semaphore:
+            # Short politeness delay; with fetches overlapped this keeps
+            # the request rate modest without serializing the wall clock
+            await asyncio.sleep(random.uniform(0.1, 0.3))
+            async with session.get(url, headers=self.headers) as response:
+                if response.status != 200:
+                    print(f"Error fetching event: {response.status}")
+                    return None
+                if (response.content_length or 0) > MAX_PAGE_BYTES:
+                    print(f"Skipping oversized page: {url}")
+                    return None
+                body = await response.content.read(MAX_PAGE_BYTES)
+                return body.decode(response.charset or 'utf-8', errors='replace')
+    
+    async def _scrape_all(self, urls):
+        """
+        Fetch and parse all event pages concurrently.
+        
+        One ClientSession with a keep-alive connection pool serves every
+        fetch, with at most MAX_CONCURRENT_FETCHES pages in flight, so
+        total wall clock is bounded by the slowest batch rather than the
+        sum of round-trips.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+        connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_FETCHES, keepalive_timeout=30)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            pages = await asyncio.gather(
+                *(self._fetch(session, url, semaphore) for url in urls),
+                return_exceptions=True
+            )
+        
+        events = []
+        for url, page in zip(urls, pages):
+            if isinstance(page, Exception):
+                print(f"Error scraping event {url}: {page}")
+                continue
+            if not page:
+                continue
+            event = self._parse_event(page, url)
+            if event:
+                events.append(event)
+        return events
     
     def scrape_event(self, event_url: str) -> Optional[Dict[str, Any]]:
-        """Scrape details for a single event"""
+        """Scrape details for a single event (synchronous convenience path)"""
         print(f"Scraping event: {event_url}")
         
         # Add delay to avoid being blocked
         time.sleep(random.uniform(1.0, 3.0))
         
         try:
-            response = requests.get(event_url, headers=self.headers)
+            body = self._get_page_text(event_url)
+            if body is None:
+                return None
+                
+            return self._parse_event(body, event_url)
+        except Exception as e:
+            print(f"Error scraping event {event_url}: {e}")
+            return None
+    
+    def _get_page_text(self, url: str) -> Optional[str]:
+        """Fetch a page body, streaming and capped at MAX_PAGE_BYTES"""
+        # Cheap HEAD precheck: skip dead URLs and non-HTML payloads
+        # (PDFs, images) before paying for the GET. Servers that reject
+        # HEAD (405/501) are treated as inconclusive, not as failures.
+        try:
+            head = self.session.head(url, allow_redirects=True, timeout=(2, 5))
+            if head.status_code not in (405, 501):
+                if head.status_code != 200:
+                    print(f"Skipping unavailable page ({head.status_code}): {url}")
+                    return None
+                content_type = head.headers.get('Content-Type', '')
+                if content_type and 'text/html' not in content_type:
+                    print(f"Skipping non-HTML page ({content_type}): {url}")
+                    return None
+        except requests.exceptions.RequestException as e:
+            print(f"Error prechecking {url}: {e}")
+            return None
+        
+        response = self.session.get(url, stream=True, timeout=(3, 10))
+        try:
             if response.status_code != 200:
                 print(f"Error fetching event: {response.status_code}")
                 return None
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
+            if int(response.headers.get('Content-Length', 0) or 0) > MAX_PAGE_BYTES:
+                print(f"Skipping oversized page: {url}")
+                return None
+            body = response.raw.read(MAX_PAGE_BYTES, decode_content=True)
+            return body.decode(response.encoding or 'utf-8', errors='replace')
+        finally:
+            response.close()
+    
+    def _parse_event(self, html: str, event_url: str) -> Optional[Dict[str, Any]]:
+        """Parse a fetched event page into an event dict"""
+        try:
+            # lxml parses with libxml2, several times faster than
+            # html.parser, and the comma-fused selectors below resolve
+            # each field's fallback chain in one C-level tree walk
+            soup = BeautifulSoup(html, 'lxml', parse_only=_EVENT_STRAINER)
+            
+            # Unexpected markup can leave the strained tree empty; only
+            # then pay for a full parse
+            if soup.select_one('h1, title, p') is None:
+                soup = BeautifulSoup(html, 'lxml')
             
             # Get event name (from title)
             event_name = None
-            for selector in ['.detail-header__title', 'h1', '.event-title', '.title']:
-                element = soup.select_one(selector)
-                if element:
-                    event_name = clean_text(element.text)
-                    break
+            element = soup.select_one(self._NAME_SEL)
+            if element:
+                event_name = clean_text(element.text)
             
             # If we still don't have a name, use the page title
             if not event_name:
@@ -184,18 +348,20 @@ class CharlestonCVBScraper(BaseEventScraper):
             
             # Get the description
             description = None
-            for selector in ['.detail-tabs__content', '.event-description', '.description', 'article p']:
-                element = soup.select_one(selector)
-                if element:
-                    description = clean_text(element.text)
-                    break
+            element = soup.select_one(self._DESC_SEL)
+            if element:
+                description = clean_text(element.text)
                     
             if not description:
                 # Try to find paragraphs in the main content
                 paragraphs = soup.select('p')
                 if paragraphs:
                     # Filter out short paragraphs and navigation elements
-                    content_paragraphs = [clean_text(p.text) for p in paragraphs if len(clean_text(p.text)) > 100]
+                    # One clean_text per paragraph; the old comprehension
+                    # cleaned every paragraph twice
+                    content_paragraphs = [
+                        t for t in (clean_text(p.text) for p in paragraphs) if len(t) > 100
+                    ]
                     if content_paragraphs:
                         description = " ".join(content_paragraphs)
                     else:
@@ -206,101 +372,64 @@ class CharlestonCVBScraper(BaseEventScraper):
             venue_name = "Unknown Venue"
             
             # Try multiple selectors for location
-            for selector in ['.detail-top__address', '.event-location', '.location', 'address']:
-                element = soup.select_one(selector)
-                if element:
-                    location = clean_text(element.text)
-                    break
+            element = soup.select_one(self._LOC_SEL)
+            if element:
+                location = clean_text(element.text)
                     
             # Get venue name from various possible elements
-            for selector in ['.detail-header__subtitle a', '.venue-name', '.location-name']:
-                element = soup.select_one(selector)
-                if element:
-                    venue_name = clean_text(element.text)
-                    break
+            element = soup.select_one(self._VENUE_SEL)
+            if element:
+                venue_name = clean_text(element.text)
             
             # Get event date and time
             date_text = ""
             time_text = ""
             
-            # Try multiple date selectors
-            for selector in ['.detail-top__date', '.event-date', '.date', 'time']:
-                element = soup.select_one(selector)
-                if element:
-                    date_text = clean_text(element.text)
-                    break
+            # Try multiple date selectors, normalizing to ISO when the
+            # text parses as a date
+            element = soup.select_one(self._DATE_SEL)
+            if element:
+                date_text = clean_text(element.text)
+                date_text = _parse_date_text(date_text) or date_text
                     
-            # If no date found, try to extract from the content
+            # If no date found, locate a date-bearing substring in the
+            # content and hand it to dateutil, which replaces the old
+            # per-pattern reconstruction branches (and handles day
+            # suffixes and missing years on its own)
             if not date_text:
-                # Look for date patterns
-                date_patterns = [
-                    # Month name followed by day and optional year
-                    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?',
-                    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?',
-                    # MM/DD/YYYY
-                    r'(\d{1,2})/(\d{1,2})/(\d{4})',
-                    # YYYY-MM-DD
-                    r'(\d{4})-(\d{1,2})-(\d{1,2})'
-                ]
-                
-                for pattern in date_patterns:
-                    match = re.search(pattern, description or "", re.IGNORECASE)
+                for pattern in _DATE_PATTERNS:
+                    match = pattern.search(description or "")
                     if match:
-                        groups = match.groups()
-                        # Process according to which pattern matched
-                        if len(groups) == 3 and groups[0] in ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'] or groups[0] in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']:
-                            # First pattern - Month day, year
-                            month, day, year = groups
-                            year = year or datetime.datetime.now().year  # Use current year if not specified
-                            date_text = f"{year}-{datetime.datetime.strptime(month[:3], '%b').month:02d}-{int(day):02d}"
-                        elif len(groups) == 3 and all(g and g.isdigit() for g in groups):
-                            if '/' in match.group(0):
-                                # MM/DD/YYYY
-                                month, day, year = groups
-                                date_text = f"{year}-{int(month):02d}-{int(day):02d}"
-                            else:
-                                # YYYY-MM-DD
-                                year, month, day = groups
-                                date_text = f"{year}-{int(month):02d}-{int(day):02d}"
+                        date_text = _parse_date_text(match.group(0))
                         break
             
             # Get time from various selectors
-            for selector in ['.detail-top__time', '.event-time', '.time']:
-                element = soup.select_one(selector)
-                if element:
-                    time_text = clean_text(element.text)
-                    break
+            element = soup.select_one(self._TIME_SEL)
+            if element:
+                time_text = clean_text(element.text)
                     
             # If no time found, try to extract from content
             if not time_text and description:
                 # Look for time patterns
-                time_patterns = [
-                    r'(\d{1,2}:\d{2}\s*[ap]m)',
-                    r'(\d{1,2}\s*[ap]m)',
-                    r'(?:at|from|starting at)\s+(\d{1,2}(?::\d{2})?\s*[ap]m)'
-                ]
-                for pattern in time_patterns:
-                    match = re.search(pattern, description, re.IGNORECASE)
+                for pattern in _TIME_PATTERNS:
+                    match = pattern.search(description)
                     if match:
                         time_text = clean_text(match.group(1))
                         break
             
             # Event image
             image_url = ""
-            for selector in ['.detail-image img', '.event-image img', 'img.event', '.featured-image img']:
-                element = soup.select_one(selector)
-                if element and element.has_attr('src'):
-                    image_url = element['src']
-                    # Make URL absolute if needed
-                    image_url = self._make_absolute_url(image_url)
-                    break
+            element = soup.select_one(self._IMG_SEL)
+            if element:
+                # Make URL absolute if needed
+                image_url = self._make_absolute_url(element['src'])
                     
             # If no specific image found, try to get any relevant image
             if not image_url:
-                images = soup.select('img')
-                for img in images:
-                    if img.has_attr('src') and not 'logo' in img['src'].lower() and not 'icon' in img['src'].lower():
-                        image_url = self._make_absolute_url(img['src'])
+                for img in soup.select('img[src]'):
+                    src = img['src']
+                    if not _BAD_IMG_RE.search(src):
+                        image_url = self._make_absolute_url(src)
                         break
                     
             # Create event dict with standard field names to match the database schema
@@ -318,12 +447,26 @@ class CharlestonCVBScraper(BaseEventScraper):
             return event
             
         except Exception as e:
-            print(f"Error scraping event {event_url}: {e}")
+            print(f"Error parsing event {event_url}: {e}")
             return None
     
+    def _canon(self, url: str) -> str:
+        """
+        Canonical form of a URL for deduplication.
+        
+        Lowercases the scheme and host, strips the trailing slash and the
+        fragment, so /events/foo, /events/foo/ and the absolute form all
+        dedupe to one fetch.
+        """
+        parts = urlsplit(self._make_absolute_url(url))
+        return urlunsplit((
+            parts.scheme.lower(), parts.netloc.lower(),
+            parts.path.rstrip('/') or '/', parts.query, ''
+        ))
+    
     def _make_absolute_url(self, url: str) -> str:
         """
-        Make a URL absolute by adding the base URL if needed
+        Make a URL absolute by resolving it against the base URL
         
         Args:
             url: URL to make absolute
@@ -331,14 +474,9 @@ class CharlestonCVBScraper(BaseEventScraper):
         Returns:
             Absolute URL
         """
-        if url.startswith('http'):
-            return url
-        elif url.startswith('//'):
-            return f"https:{url}"
-        elif url.startswith('/'):
-            return f"{self.base_url.rstrip('/')}{url}"
-        else:
-            return f"{self.base_url.rstrip('/')}/{url}"
+        # urljoin handles absolute, protocol-relative, absolute-path and
+        # relative URLs in one C-level call, with no per-call rstrip
+        return urljoin(self.base_url, url)
 
 
 if __name__ == "__main__":
@@ -10,14 +10,17 @@ import time
 import random
 import os
 import json
-import pandas as pd
+import csv
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Union
 
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 
-from data_collection.scrapers import BaseEventScraper
+from data_collection.scrapers import BaseEventScraper, register_scraper
 from data_collection.utils import (
     clean_text,
     get_soup,
@@ -30,10 +33,73 @@ from data_collection.utils import (
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Patterns used in the per-page/per-paragraph hot paths, compiled once at
+# import instead of being re-parsed on every call
+_MONTH_DAY_RE = re.compile(
+    r'(January|February|March|April|May|June|July|August|September|October|November|December)'
+    r'\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?'
+)
+# One alternation scans each paragraph once for both the time and the
+# "at <Venue>" location; the time branch is case-insensitive, the location
+# branch still requires a capitalized venue name
+_EVENT_INFO_RE = re.compile(
+    r'(?i:(?P<time>\d{1,2}(?::\d{2})?\s*[ap]m))|at\s+(?:the\s+)?(?P<loc>[A-Z][^\.]+)'
+)
+_MONTH_NAMES = ['January', 'February', 'March', 'April', 'May', 'June', 'July',
+                'August', 'September', 'October', 'November', 'December']
+# Month name (and 3-letter abbreviation) to month number; replaces per-match
+# strptime('%b') calls in the date-parsing loops
+_MONTH_NUM = {name: i for i, name in enumerate(_MONTH_NAMES, 1)}
+_MONTH_NUM.update({name[:3]: i for i, name in enumerate(_MONTH_NAMES, 1)})
+_MONTH_SET = frozenset(_MONTH_NUM)
+# How much of an event description to scan for date/time mentions
+_DESC_SCAN_LIMIT = 2000
+_PARAGRAPH_TIME_RE = re.compile(r'(\d{1,2}(?::\d{2})?\s*[ap]m)', re.IGNORECASE)
+_OCC_DTSTART_RE = re.compile(r'occ_dtstart=(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2})')
+_EVENT_HREF_RE = re.compile(r'/events?/|trumba\.com|calendar.*\?date=')
+_VENUE_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in [
+        r'(?:at|venue|location):\s*([^\.]+)',
+        r'(?:at|venue|location)[:\s]+([^\.]+)',
+        r'(?:will take place|held) at\s+([^\.]+)',
+        r'(?:will be|is|at) (?:the|in|at)\s+([A-Z][^\.]+)'  # Capitalized venue names
+    ]
+]
+_DATE_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in [
+        # Month name followed by day and optional year
+        r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?',
+        r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?',
+        # Day followed by month name
+        r'(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?(January|February|March|April|May|June|July|August|September|October|November|December)(?:,?\s+(\d{4}))?',
+        # MM/DD/YYYY
+        r'(\d{1,2})/(\d{1,2})/(\d{4})',
+        # YYYY-MM-DD
+        r'(\d{4})-(\d{1,2})-(\d{1,2})'
+    ]
+]
+_TIME_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in [
+        r'(\d{1,2}:\d{2}\s*[ap]m)',
+        r'(\d{1,2}\s*[ap]m)',
+        r'(?:at|from|starting at)\s+(\d{1,2}(?::\d{2})?\s*[ap]m)'
+    ]
+]
+
 
+@register_scraper
 class HolyCitySinnerScraper(BaseEventScraper):
     """Scraper for HolyCitySinner website events"""
-    
+
+    # Fused selector groups for scrape_event: one comma-joined selector per
+    # field means one DOM traversal instead of one per candidate selector
+    _NAME_SEL = 'h1.entry-title, h1, .post-title, .title, .mp-event-name'
+    _DESC_SEL = '.entry-content, .post-content, article p, .mp-event-description'
+    _LOC_SEL = '.event-venue, .mp-event-location, .location, .venue'
+    _IMG_SEL = ('.wp-post-image[src], article img[src], .post-thumbnail img[src], '
+                '.event-image img[src], .mp-event-image img[src]')
+
+
     def __init__(self, db_connection=None):
         """Initialize the scraper"""
         super().__init__(db_connection)
@@ -43,6 +109,29 @@ class HolyCitySinnerScraper(BaseEventScraper):
         self.weekend_events_url = "https://holycitysinner.com/lifestyle/charleston-weekend-events/"
         self.mobile_events_url = "https://holycitysinner.com/entertainment/things-to-do-in-charleston-events-parties-plans-mobile/"
         self.headers = get_headers()
+        # One pooled session for every fetch: the scraper hits many URLs on
+        # the same host, so reusing sockets avoids a TCP+TLS handshake per page
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Per-run soup cache: the calendar, weekend, and mobile pages get
+        # requested from more than one code path in a single get_all_events run
+        self._soup_cache = {}
+
+    def _soup(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch a page through the shared session, caching the parsed soup by URL"""
+        soup = self._soup_cache.get(url)
+        if soup is None:
+            soup = get_soup(url, session=self.session)
+            if soup is not None:
+                self._soup_cache[url] = soup
+        return soup
         
     @property
     def source_name(self) -> str:
@@ -62,7 +151,12 @@ class HolyCitySinnerScraper(BaseEventScraper):
             List of event dictionaries
         """
         all_events = []
-        
+        # Hashes of URLs already collected, kept live so each merge is an
+        # O(1) lookup instead of rebuilding a set over all_events per source.
+        # Storing 64-bit hashes instead of 100-200 byte URL strings keeps the
+        # set small on long multi-source runs
+        seen_urls = set()
+
         # Get current date info
         if not start_date:
             today = datetime.now()
@@ -84,43 +178,46 @@ class HolyCitySinnerScraper(BaseEventScraper):
         if web_events:
             print(f"Found {len(web_events)} events from calendar scraping")
             all_events.extend(web_events)
+            seen_urls.update(hash(event.get('URL')) for event in web_events)
         
         # 2. Try the weekend events page
         print("Attempting to fetch weekend events...")
         weekend_events = self.fetch_weekend_events()
         if weekend_events:
             # Deduplicate events by URL
-            existing_urls = {event.get('URL') for event in all_events}
-            unique_weekend_events = [e for e in weekend_events if e.get('URL') not in existing_urls]
+            unique_weekend_events = [e for e in weekend_events if hash(e.get('URL')) not in seen_urls]
             print(f"Adding {len(unique_weekend_events)} unique events from weekend events")
             all_events.extend(unique_weekend_events)
+            seen_urls.update(hash(event.get('URL')) for event in unique_weekend_events)
             
         # 3. Try the mobile events page
         print("Attempting to fetch events from mobile events page...")
         try:
-            mobile_soup = get_soup(self.mobile_events_url)
+            mobile_soup = self._soup(self.mobile_events_url)
             if mobile_soup:
                 content_elem = mobile_soup.select_one('article') or mobile_soup.select_one('.entry-content')
                 if content_elem:
                     mobile_events = self._extract_events_from_text(content_elem.text, self.mobile_events_url)
                     if mobile_events:
                         # Deduplicate events
-                        existing_urls = {event.get('URL') for event in all_events}
-                        unique_mobile_events = [e for e in mobile_events if e.get('URL') not in existing_urls]
+                        unique_mobile_events = [e for e in mobile_events if hash(e.get('URL')) not in seen_urls]
                         print(f"Adding {len(unique_mobile_events)} unique events from mobile events page")
                         all_events.extend(unique_mobile_events)
+                        seen_urls.update(hash(event.get('URL')) for event in unique_mobile_events)
         except Exception as e:
             print(f"Error fetching mobile events: {e}")
         
-        # Filter out events with suspicious dates (far in the future)
-        filtered_events = []
-        for event in all_events:
-            event_date = event.get('Date')
-            if event_date and event_date <= max_date_threshold:
-                filtered_events.append(event)
-            else:
-                print(f"Filtering out event with suspicious date: {event.get('Name')} - {event_date}")
+        # Filter out events with suspicious dates (far in the future) in one
+        # pass, reporting a single summary instead of printing per reject
+        filtered_events = [e for e in all_events
+                           if (d := e.get('Date')) and d <= max_date_threshold]
+        dropped = len(all_events) - len(filtered_events)
+        if dropped:
+            print(f"Filtered out {dropped} events with missing or suspicious dates past {max_date_threshold}")
         
+        # Drop the cached soups; the next run should see fresh pages
+        self._soup_cache.clear()
+
         print(f"Total valid unique events found: {len(filtered_events)}")
         return filtered_events
     
@@ -147,33 +244,29 @@ class HolyCitySinnerScraper(BaseEventScraper):
         
         try:
             # Try to fetch the main events page
-            soup = get_soup(self.events_url)
+            soup = self._soup(self.events_url)
             if not soup:
                 print(f"Error fetching events page: {self.events_url}")
                 return []
                 
-            # Find event links - various patterns that might indicate event pages
-            event_links = []
-            
-            # Look for links that might be event pages
-            for link in soup.select('a'):
+            # Find event links - various patterns that might indicate event pages:
+            # /events/ or /event/ paths, links to mylonews.trumba.com, and
+            # calendar links with date parameters. The attribute-contains
+            # selector narrows the candidates inside lxml's C engine; the
+            # compiled regex handles the calendar+?date= conjunction. A dict
+            # keyed by URL dedups in O(1) while preserving discovery order.
+            event_links = {}
+            candidates = soup.select(
+                'a[href*="/events/"], a[href*="/event/"], '
+                'a[href*="trumba.com"], a[href*="calendar"]'
+            )
+            for link in candidates:
                 href = link.get('href')
-                if not href:
+                if not href or not _EVENT_HREF_RE.search(href):
                     continue
-                
-                # Various patterns that might indicate an event link
-                # 1. Links with /events/ in them
-                # 2. Links with /event/ in them
-                # 3. Links that point to mylonews.trumba.com
-                # 4. Links that contain "calendar" and have date parameters
-                if (('/events/' in href or '/event/' in href) or 
-                    ('trumba.com' in href) or 
-                    ('calendar' in href and '?date=' in href)):
-                    
-                    # Make the URL absolute if it's relative
-                    event_url = self._make_absolute_url(href)
-                    if event_url not in event_links:
-                        event_links.append(event_url)
+
+                # Make the URL absolute if it's relative
+                event_links.setdefault(self._make_absolute_url(href), None)
             
             print(f"Found {len(event_links)} potential event links")
             
@@ -191,15 +284,15 @@ class HolyCitySinnerScraper(BaseEventScraper):
                 
                 for url in alternate_urls:
                     try:
-                        alt_soup = get_soup(url)
+                        alt_soup = self._soup(url)
                         if alt_soup:
-                            for link in alt_soup.select('a'):
+                            for link in alt_soup.select(
+                                    'a[href*="/events/"], a[href*="/event/"], '
+                                    'a[href*="trumba.com"]'):
                                 href = link.get('href')
-                                if href and (('/events/' in href or '/event/' in href) or 
-                                            ('trumba.com' in href)):
-                                    event_url = self._make_absolute_url(href)
-                                    if event_url not in event_links:
-                                        event_links.append(event_url)
+                                if not href:
+                                    continue
+                                event_links.setdefault(self._make_absolute_url(href), None)
                     except Exception as e:
                         print(f"Error with alternate URL {url}: {e}")
             
@@ -211,24 +304,25 @@ class HolyCitySinnerScraper(BaseEventScraper):
                     direct_events = self._extract_events_from_text(content_elem.text, self.events_url)
                     return direct_events
             
-            # Scrape each potential event page
+            # Scrape the event pages in parallel; the pooled session handles
+            # connection reuse and the per-task delay keeps the request rate polite
             events = []
-            for url in event_links:
-                # Add delay to avoid being blocked
-                time.sleep(random.uniform(1.0, 3.0))
-                
-                event_data = self.scrape_event(url)
-                if event_data:
-                    # Validate the event date is within our range
-                    event_date = event_data.get('Date')
-                    if event_date:
-                        if start_date <= event_date <= end_date:
-                            events.append(event_data)
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                futures = [executor.submit(self._scrape_event_politely, url)
+                           for url in event_links]
+                for future in as_completed(futures):
+                    event_data = future.result()
+                    if event_data:
+                        # Validate the event date is within our range
+                        event_date = event_data.get('Date')
+                        if event_date:
+                            if start_date <= event_date <= end_date:
+                                events.append(event_data)
+                            else:
+                                print(f"Skipping event outside date range: {event_data.get('Name')} on {event_date}")
                         else:
-                            print(f"Skipping event outside date range: {event_data.get('Name')} on {event_date}")
-                    else:
-                        # If no date, still include the event as it might be relevant
-                        events.append(event_data)
+                            # If no date, still include the event as it might be relevant
+                            events.append(event_data)
             
             print(f"Successfully scraped {len(events)} events")
             return events
@@ -245,7 +339,7 @@ class HolyCitySinnerScraper(BaseEventScraper):
             List of event dictionaries
         """
         try:
-            soup = get_soup(self.weekend_events_url)
+            soup = self._soup(self.weekend_events_url)
             if not soup:
                 print(f"Error fetching weekend events page: {self.weekend_events_url}")
                 return []
@@ -281,27 +375,28 @@ class HolyCitySinnerScraper(BaseEventScraper):
         events = []
         
         # Look for date patterns
-        date_matches = list(re.finditer(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?', text))
+        date_matches = list(_MONTH_DAY_RE.finditer(text))
         
         # If no dates found, return empty list
         if not date_matches:
             return []
             
-        # Get current year for filling in missing year values
-        current_year = datetime.now().year
-            
+        # Current time, fetched once for the whole loop: fills in missing
+        # years and anchors the "probably next year" check
+        now = datetime.now()
+
         # Process each date match
         for i, match in enumerate(date_matches):
             try:
                 # Get the date
                 month, day, year = match.groups()
                 # If year is missing, use current year
-                year = year or str(current_year)
-                
+                year = year or str(now.year)
+
                 try:
-                    date_obj = datetime.strptime(f"{month} {day}, {year}", "%B %d, %Y")
+                    date_obj = datetime(int(year), _MONTH_NUM[month], int(day))
                     # If the date is more than 6 months in the past, it's probably next year
-                    if (datetime.now() - date_obj).days > 180:
+                    if (now - date_obj).days > 180:
                         date_obj = date_obj.replace(year=date_obj.year + 1)
                     
                     date_str = date_obj.strftime('%Y-%m-%d')
@@ -316,7 +411,7 @@ class HolyCitySinnerScraper(BaseEventScraper):
                     content = text[match.end():]
                     
                 # Split the content into paragraphs
-                paragraphs = [p.strip() for p in content.split('\n') if p.strip()]
+                paragraphs = [p.strip() for p in content.splitlines() if p.strip()]
                 
                 # Process each paragraph as a potential event
                 for j, paragraph in enumerate(paragraphs):
@@ -324,18 +419,28 @@ class HolyCitySinnerScraper(BaseEventScraper):
                     if len(paragraph) < 20:
                         continue
                         
-                    # Extract location - often in format "at Location" or "at the Location"
+                    # Extract location ("at Location" / "at the Location") and
+                    # time in one scan over the paragraph
                     location = None
-                    location_match = re.search(r'at\s+(?:the\s+)?([A-Z][^\.]+)', paragraph)
-                    if location_match:
-                        location = location_match.group(1).strip()
-                        
-                    # Extract time
-                    time_match = re.search(r'(\d{1,2}(?::\d{2})?\s*[ap]m)', paragraph, re.IGNORECASE)
-                    time_str = time_match.group(1) if time_match else ""
+                    time_str = ""
+                    for info in _EVENT_INFO_RE.finditer(paragraph):
+                        if info.group('time'):
+                            if not time_str:
+                                time_str = info.group('time')
+                        elif location is None:
+                            location = info.group('loc').strip()
+                        if time_str and location:
+                            break
+
+                    # A time mention swallowed by the location span (e.g.
+                    # "at The Venue, 8 pm tonight") still gets picked up here
+                    if not time_str and location:
+                        time_match = _PARAGRAPH_TIME_RE.search(location)
+                        if time_match:
+                            time_str = time_match.group(1)
                     
                     # Extract title - use the first sentence or first 100 characters
-                    title = paragraph.split('.')[0]
+                    title = paragraph.partition('.')[0]
                     if len(title) > 100:
                         title = title[:100] + "..."
                         
@@ -355,6 +460,15 @@ class HolyCitySinnerScraper(BaseEventScraper):
                 
         return events
     
+    def _scrape_event_politely(self, event_url: str) -> Optional[Dict[str, Any]]:
+        """Scrape one event after a short random delay to stay polite under parallelism"""
+        time.sleep(random.uniform(0.2, 0.6))
+        try:
+            return self.scrape_event(event_url)
+        except Exception as e:
+            print(f"Error scraping event {event_url}: {e}")
+            return None
+
     def scrape_event(self, event_url: str) -> Optional[Dict[str, Any]]:
         """
         Scrape details for a single event
@@ -379,7 +493,7 @@ class HolyCitySinnerScraper(BaseEventScraper):
             
             # Check for date in URL (format: occ_dtstart=YYYY-MM-DDThh:mm)
             if 'occ_dtstart=' in event_url:
-                date_match = re.search(r'occ_dtstart=(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2})', event_url)
+                date_match = _OCC_DTSTART_RE.search(event_url)
                 if date_match:
                     date_text = date_match.group(1)
                     hour = int(date_match.group(2).split(':')[0])
@@ -389,7 +503,7 @@ class HolyCitySinnerScraper(BaseEventScraper):
                         hour -= 12
                     time_text = f"{hour}:{minutes} {am_pm}"
             
-            soup = get_soup(event_url)
+            soup = self._soup(event_url)
             if not soup:
                 print(f"Error fetching page: {event_url}")
                 return None
@@ -398,11 +512,9 @@ class HolyCitySinnerScraper(BaseEventScraper):
             # Just get the event details
             # First get the event name (title)
             name = None
-            for selector in ['h1.entry-title', 'h1', '.post-title', '.title', '.mp-event-name']:
-                element = soup.select_one(selector)
-                if element:
-                    name = clean_text(element.text)
-                    break
+            element = soup.select_one(self._NAME_SEL)
+            if element:
+                name = clean_text(element.text)
             
             # If we still don't have a name, use the page title
             if not name:
@@ -412,7 +524,7 @@ class HolyCitySinnerScraper(BaseEventScraper):
             
             if not name:
                 # If all else fails, try to extract name from URL
-                url_name = event_url.split('/events/')[1].split('/?')[0] if '/events/' in event_url else ""
+                url_name = event_url.partition('/events/')[2].partition('/?')[0]
                 if url_name:
                     # Convert hyphen-case to title case
                     name = ' '.join(word.capitalize() for word in url_name.replace('-', ' ').split())
@@ -421,11 +533,9 @@ class HolyCitySinnerScraper(BaseEventScraper):
             
             # Get the description
             description = None
-            for selector in ['.entry-content', '.post-content', 'article p', '.mp-event-description']:
-                element = soup.select_one(selector)
-                if element:
-                    description = clean_text(element.text)
-                    break
+            element = soup.select_one(self._DESC_SEL)
+            if element:
+                description = clean_text(element.text)
                 
             if not description:
                 # Try to find paragraphs in the main content
@@ -442,23 +552,14 @@ class HolyCitySinnerScraper(BaseEventScraper):
             location = None
             
             # Look for venue information in specific selectors
-            for selector in ['.event-venue', '.mp-event-location', '.location', '.venue']:
-                element = soup.select_one(selector)
-                if element:
-                    location = clean_text(element.text)
-                    break
+            element = soup.select_one(self._LOC_SEL)
+            if element:
+                location = clean_text(element.text)
             
             # If no location found, search in content
             if not location and description:
-                venue_patterns = [
-                    r'(?:at|venue|location):\s*([^\.]+)',
-                    r'(?:at|venue|location)[:\s]+([^\.]+)',
-                    r'(?:will take place|held) at\s+([^\.]+)',
-                    r'(?:will be|is|at) (?:the|in|at)\s+([A-Z][^\.]+)'  # Capitalized venue names
-                ]
-                
-                for pattern in venue_patterns:
-                    match = re.search(pattern, description, re.IGNORECASE)
+                for pattern in _VENUE_PATTERNS:
+                    match = pattern.search(description)
                     if match:
                         location = clean_text(match.group(1))
                         # Limit to reasonable length for a venue name
@@ -466,40 +567,29 @@ class HolyCitySinnerScraper(BaseEventScraper):
                             location = location[:100]
                         break
             
-            # If we don't already have date/time from URL
-            if not date_text and description:
+            # If we don't already have date/time from URL. Date and time
+            # mentions almost always appear early, so scan only the head of
+            # the description to bound worst-case regex time per event.
+            desc_head = description[:_DESC_SCAN_LIMIT] if description else None
+            if not date_text and desc_head:
                 # Look for date patterns
-                date_patterns = [
-                    # Month name followed by day and optional year
-                    r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?',
-                    r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+(\d{1,2})(?:st|nd|rd|th)?(?:,?\s+(\d{4}))?',
-                    # Day followed by month name
-                    r'(\d{1,2})(?:st|nd|rd|th)?\s+(?:of\s+)?(January|February|March|April|May|June|July|August|September|October|November|December)(?:,?\s+(\d{4}))?',
-                    # MM/DD/YYYY
-                    r'(\d{1,2})/(\d{1,2})/(\d{4})',
-                    # YYYY-MM-DD
-                    r'(\d{4})-(\d{1,2})-(\d{1,2})'
-                ]
-                
-                for pattern in date_patterns:
-                    match = re.search(pattern, description, re.IGNORECASE)
+                for pattern in _DATE_PATTERNS:
+                    match = pattern.search(desc_head)
                     if match:
                         groups = match.groups()
                         current_year = datetime.now().year
                         
                         # Process according to which pattern matched
-                        if len(groups) == 3 and groups[0] in ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'] or groups[0] in ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']:
+                        if len(groups) == 3 and groups[0] in _MONTH_SET:
                             # First pattern - Month day, year
                             month, day, year = groups
                             year = year or current_year  # Use current year if not specified
-                            month_num = datetime.strptime(month[:3], '%b').month
-                            date_text = f"{year}-{month_num:02d}-{int(day):02d}"
-                        elif len(groups) == 3 and groups[1] in ['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December']:
+                            date_text = f"{year}-{_MONTH_NUM[month[:3]]:02d}-{int(day):02d}"
+                        elif len(groups) == 3 and groups[1] in _MONTH_SET:
                             # Third pattern - Day month, year
                             day, month, year = groups
                             year = year or current_year  # Use current year if not specified
-                            month_num = datetime.strptime(month[:3], '%b').month
-                            date_text = f"{year}-{month_num:02d}-{int(day):02d}"
+                            date_text = f"{year}-{_MONTH_NUM[month[:3]]:02d}-{int(day):02d}"
                         elif len(groups) == 3 and all(g and g.isdigit() for g in groups):
                             if '/' in match.group(0):
                                 # MM/DD/YYYY
@@ -512,28 +602,21 @@ class HolyCitySinnerScraper(BaseEventScraper):
                         break
             
             # If we don't already have time from URL
-            if not time_text and description:
+            if not time_text and desc_head:
                 # Look for time patterns
-                time_patterns = [
-                    r'(\d{1,2}:\d{2}\s*[ap]m)',
-                    r'(\d{1,2}\s*[ap]m)',
-                    r'(?:at|from|starting at)\s+(\d{1,2}(?::\d{2})?\s*[ap]m)'
-                ]
-                for pattern in time_patterns:
-                    match = re.search(pattern, description, re.IGNORECASE)
+                for pattern in _TIME_PATTERNS:
+                    match = pattern.search(desc_head)
                     if match:
                         time_text = clean_text(match.group(1))
                         break
             
-            # Get the event image
+            # Get the event image; the [src] attribute filters live in the
+            # fused selector so the match always carries a source
             image_url = None
-            for selector in ['.wp-post-image', 'article img', '.post-thumbnail img', '.event-image img', '.mp-event-image img']:
-                element = soup.select_one(selector)
-                if element and element.has_attr('src'):
-                    image_url = element['src']
-                    # Make URL absolute if needed
-                    image_url = self._make_absolute_url(image_url)
-                    break
+            element = soup.select_one(self._IMG_SEL)
+            if element:
+                # Make URL absolute if needed
+                image_url = self._make_absolute_url(element['src'])
                     
             # If no specific image found, try to get any relevant image
             if not image_url:
@@ -611,9 +694,14 @@ class HolyCitySinnerScraper(BaseEventScraper):
             # Set the full path for the CSV file
             csv_path = os.path.join(data_dir, filename)
             
-            # Convert events to DataFrame and save to CSV
-            df = pd.DataFrame(events)
-            df.to_csv(csv_path, index=False)
+            # Write the events with the stdlib csv module; the fixed field
+            # set matches the dicts built by scrape_event
+            fieldnames = ['Name', 'Description', 'Date', 'Time', 'Location',
+                          'URL', 'Image_URL', 'Source']
+            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+                writer.writeheader()
+                writer.writerows(events)
             
             print(f"Successfully saved {len(events)} events to {csv_path}")
             return True
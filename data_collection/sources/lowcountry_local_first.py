@@ -8,22 +8,82 @@ member directory at https://www.lowcountrylocalfirst.org/member-directory
 import os
 import json
 import time
+import asyncio
+import hashlib
+import functools
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-import pandas as pd
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
 import re
 import random
+from operator import itemgetter
 from urllib.parse import urljoin
 import csv
 
-from data_collection.scrapers import BaseEventScraper
+from data_collection.scrapers import BaseEventScraper, register_scraper
+
+# orjson parses and serializes several times faster than stdlib json; fall
+# back to the stdlib when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# CSV column headers and the matching projection over the business dicts
+# produced by parse_business_from_json (which always sets every key)
+_CSV_HEADER = ['Name', 'Address', 'Phone', 'Email', 'Website', 'Category',
+               'Description', 'Image_URL', 'Source']
+_CSV_ROW = itemgetter('name', 'location', 'phone', 'email', 'website',
+                      'category', 'description', 'image_url', 'source')
+
+# Field mappings used for every parsed business, built once at import
+_FIELD_MAP = (('name', 'Name'), ('description', 'Description'),
+              ('category', 'MemberTypeDisplay'), ('website', 'Website'),
+              ('email', 'Email'), ('phone', 'Phone'), ('image_url', 'LogoUrl'))
+_ADDR_KEYS = ('Line1', 'Line2', 'City', 'State', 'PostalCode')
+
+class _TokenBucket:
+    """
+    Minimal adaptive token-bucket rate limiter
+
+    acquire() blocks until a token is available at the current rate. The
+    rate halves when the server looks stressed and creeps back toward the
+    configured cap while responses stay fast.
+    """
+
+    def __init__(self, rate=1.0, capacity=3):
+        self.rate = rate
+        self.max_rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def acquire(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens < 1.0:
+            time.sleep((1.0 - self.tokens) / self.rate)
+            self.updated = time.monotonic()
+            self.tokens = 1.0
+        self.tokens -= 1.0
+
+    def slow_down(self):
+        self.rate = max(self.rate / 2.0, 0.1)
+
+    def speed_up(self):
+        self.rate = min(self.rate * 1.25, self.max_rate)
+
+
+@register_scraper
 class LowcountryLocalFirstScraper(BaseEventScraper):
     """Scraper for collecting business data from Lowcountry Local First member directory"""
     
@@ -68,6 +128,15 @@ class LowcountryLocalFirstScraper(BaseEventScraper):
         """
         super().__init__(db_connection)
         self.session = requests.Session()
+        # Every request hits the same host, so keep a persistent pool of
+        # keep-alive connections instead of the default adapter settings
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         # Add common headers to mimic a browser
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
@@ -79,6 +148,41 @@ class LowcountryLocalFirstScraper(BaseEventScraper):
             'X-Requested-With': 'XMLHttpRequest',
             'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
         })
+        # Paces requests off server health instead of a fixed sleep per fetch
+        self._limiter = _TokenBucket(rate=1.0, capacity=3)
+        # Static part of the urlencoded POST body; only pageNumber (and the
+        # occasional memberTypeIDs) varies per request
+        self._body_prefix = 'directoryID=1&searchText='
+        # Validator cache for conditional requests: maps (category, page) to
+        # the ETag/Last-Modified the server sent plus the parsed body, so a
+        # 304 (or an unchanged body hash) skips the re-download/re-parse
+        self._http_cache = self._load_http_cache()
+
+    def _http_cache_path(self) -> str:
+        """Path of the sidecar file persisting response validators between runs"""
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return os.path.join(project_root, 'data', 'llf_cache.json')
+
+    def _load_http_cache(self) -> Dict:
+        try:
+            with open(self._http_cache_path(), 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson is not None else json.loads(data)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_http_cache(self):
+        try:
+            cache_path = self._http_cache_path()
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            if orjson is not None:
+                with open(cache_path, 'wb') as f:
+                    f.write(orjson.dumps(self._http_cache))
+            else:
+                with open(cache_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._http_cache, f)
+        except OSError as e:
+            logger.warning(f"Could not persist HTTP validator cache: {e}")
     
     @property
     def source_name(self) -> str:
@@ -92,6 +196,69 @@ class LowcountryLocalFirstScraper(BaseEventScraper):
         """
         return self.CATEGORIES
     
+    def _request_data(self, page, category=None) -> str:
+        """
+        Build the urlencoded POST body the member-list API expects
+
+        The session already sends the form-urlencoded Content-Type, so the
+        pre-encoded string skips requests' per-call dict encode.
+        """
+        body = f"{self._body_prefix}&pageNumber={page}"
+
+        # Add category filter if specified
+        if category:
+            member_type_id = self.get_category_id(category)
+            if member_type_id:
+                body += f"&memberTypeIDs={member_type_id}"
+
+        return body
+
+    async def _fetch_page(self, session, semaphore, page, category=None) -> Dict:
+        """
+        Fetch one directory page through the shared aiohttp session
+
+        The semaphore bounds in-flight requests and the short random sleep
+        keeps the aggregate request rate polite.
+        """
+        error_response = {"Status": "Error", "Members": [], "TotalCount": 0}
+        async with semaphore:
+            await asyncio.sleep(random.uniform(0.3, 0.8))
+            try:
+                async with session.post(self.MEMBER_LIST_API,
+                                        data=self._request_data(page, category)) as response:
+                    if response.status != 200:
+                        logger.error(f"Error fetching directory data: {response.status}")
+                        return error_response
+                    body = await response.read()
+            except Exception as e:
+                logger.error(f"Exception during directory data fetch: {e}")
+                return error_response
+
+        try:
+            if orjson is not None:
+                return orjson.loads(body)
+            return json.loads(body)
+        except ValueError:
+            logger.error(f"Failed to parse JSON response: {body[:100]}...")
+            return error_response
+
+    async def _fetch_pages_async(self, pages, category=None) -> List[Dict]:
+        """Fetch several directory pages concurrently"""
+        semaphore = asyncio.Semaphore(4)
+        connector = aiohttp.TCPConnector(limit=8)
+        headers = dict(self.session.headers)
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            return await asyncio.gather(
+                *[self._fetch_page(session, semaphore, page, category) for page in pages]
+            )
+
+    def _fetch_pages(self, pages, category=None) -> List[Dict]:
+        """Sync wrapper fetching the given page numbers concurrently, in order"""
+        pages = list(pages)
+        if not pages:
+            return []
+        return asyncio.run(self._fetch_pages_async(pages, category))
+
     def fetch_directory_data(self, page=1, category=None) -> Dict:
         """
         Fetch the business listings via the AJAX API endpoint
@@ -105,35 +272,64 @@ class LowcountryLocalFirstScraper(BaseEventScraper):
         """
         try:
             logger.info(f"Fetching directory data for page {page} with category filter: {category}")
-            
-            # The API expects a POST request with specific parameters
-            data = {
-                'directoryID': '1',  # Default directory ID based on the website
-                'pageNumber': page,
-                'searchText': '',
-            }
-            
-            # Add category filter if specified
-            if category:
-                member_type_id = self.get_category_id(category)
-                if member_type_id:
-                    data['memberTypeIDs'] = member_type_id
-            
-            # Make the POST request to the API
+
+            # Send the validators from the last run so an unchanged page can
+            # come back as a bodyless 304
+            cache_key = f"{category or ''}|{page}"
+            cached = self._http_cache.get(cache_key)
+            headers = {}
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+
+            # Make the POST request to the API, paced by the token bucket
+            self._limiter.acquire()
+            start = time.monotonic()
             response = self.session.post(
                 self.MEMBER_LIST_API,
-                data=data
+                data=self._request_data(page, category),
+                headers=headers or None
             )
-            
-            # Add a delay to avoid overwhelming the server
-            time.sleep(random.uniform(1.0, 2.0))
-            
+            elapsed = time.monotonic() - start
+
+            # Back off when the server struggles; recover while it's healthy
+            if response.status_code in (429, 503) or elapsed > 2.0:
+                self._limiter.slow_down()
+            elif response.status_code == 200 and elapsed < 0.3:
+                self._limiter.speed_up()
+
+            if response.status_code == 304 and cached:
+                logger.info(f"Page {page} unchanged (304); using cached payload")
+                return cached['body']
+
             if response.status_code == 200:
+                # Servers that ignore conditional headers on POST still send
+                # the same bytes; an unchanged hash skips the re-parse
+                body_sha = hashlib.sha256(response.content).hexdigest()
+                if cached and cached.get('body_sha') == body_sha:
+                    return cached['body']
+
                 try:
-                    return response.json()
-                except json.JSONDecodeError:
+                    # Parse the raw bytes directly, skipping the str decode
+                    # that response.json() would do first
+                    if orjson is not None:
+                        parsed = orjson.loads(response.content)
+                    else:
+                        parsed = json.loads(response.content)
+                except ValueError:
                     logger.error(f"Failed to parse JSON response: {response.text[:100]}...")
                     return {"Status": "Error", "Members": [], "TotalCount": 0}
+
+                self._http_cache[cache_key] = {
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'body_sha': body_sha,
+                    'body': parsed,
+                }
+                self._save_http_cache()
+                return parsed
             else:
                 logger.error(f"Error fetching directory data: {response.status_code}")
                 return {"Status": "Error", "Members": [], "TotalCount": 0}
@@ -142,6 +338,11 @@ class LowcountryLocalFirstScraper(BaseEventScraper):
             logger.error(f"Exception during directory data fetch: {str(e)}")
             return {"Status": "Error", "Members": [], "TotalCount": 0}
     
+    @functools.lru_cache(maxsize=64)
+    def _page1(self, category=None) -> Dict:
+        """Fetch page 1 for a category, memoized so repeated calls reuse the payload"""
+        return self.fetch_directory_data(page=1, category=category)
+
     def get_category_id(self, category_name: str) -> Optional[str]:
         """
         Get the category ID based on the category name.
@@ -164,93 +365,87 @@ class LowcountryLocalFirstScraper(BaseEventScraper):
         """
         try:
             # Extract basic info
-            business = {
-                'name': business_json.get('Name', ''),
-                'description': business_json.get('Description', ''),
-                'category': business_json.get('MemberTypeDisplay', ''),
-                'website': business_json.get('Website', ''),
-                'email': business_json.get('Email', ''),
-                'phone': business_json.get('Phone', ''),
-                'location': '',
-                'image_url': business_json.get('LogoUrl', ''),
-                'source': self.source_name
-            }
-            
-            # Extract address info
-            shipping_address = business_json.get('ShippingAddress', {})
+            business = {dst: business_json.get(src, '') for dst, src in _FIELD_MAP}
+            business['location'] = ''
+            business['source'] = self.source_name
+
+            # Extract address info, reading each key once
+            shipping_address = business_json.get('ShippingAddress')
             if shipping_address:
-                address_parts = []
-                if shipping_address.get('Line1'):
-                    address_parts.append(shipping_address.get('Line1', ''))
-                if shipping_address.get('Line2'):
-                    address_parts.append(shipping_address.get('Line2', ''))
-                if shipping_address.get('City'):
-                    address_parts.append(shipping_address.get('City', ''))
-                if shipping_address.get('State'):
-                    address_parts.append(shipping_address.get('State', ''))
-                if shipping_address.get('PostalCode'):
-                    address_parts.append(shipping_address.get('PostalCode', ''))
-                
-                business['location'] = ', '.join(filter(None, address_parts))
+                business['location'] = ', '.join(
+                    part for key in _ADDR_KEYS
+                    if (part := shipping_address.get(key))
+                )
             
             return business
             
         except Exception as e:
             logger.error(f"Error parsing business from JSON: {e}")
+            # Keep the full key set so downstream projections never miss keys
             return {
                 'name': business_json.get('Name', 'Unknown'),
+                'description': '', 'category': '', 'website': '', 'email': '',
+                'phone': '', 'location': '', 'image_url': '',
                 'source': self.source_name
             }
     
-    def scrape_event(self, category: str) -> Optional[Dict[str, Any]]:
+    def scrape_event(self, category: str, max_businesses=None, max_pages=None) -> Optional[Dict[str, Any]]:
         """
         Scrape businesses for a given category
-        
+
         Args:
             category: Category to scrape
-            
+            max_businesses: Optional cap on businesses returned; pagination
+                stops as soon as the quota is reached
+            max_pages: Optional cap on pages fetched
+
         Returns:
             Dictionary containing the category and list of businesses
         """
         try:
             logger.info(f"Scraping businesses for category: {category}")
-            
-            # Fetch the first page and get total count
-            response_data = self.fetch_directory_data(page=1, category=category)
-            
+
+            # Fetch the first page (memoized) and get total count
+            response_data = self._page1(category)
+
             if response_data.get('Status') != 'OK':
                 logger.error(f"API returned error status: {response_data.get('Status')}")
                 return None
-            
+
             total_count = response_data.get('TotalCount', 0)
             page_size = 10  # Default page size used by the website
             total_pages = (total_count + page_size - 1) // page_size
-            
+            if max_pages:
+                total_pages = min(total_pages, int(max_pages))
+
             logger.info(f"Found {total_count} businesses across {total_pages} pages")
-            
+
             businesses = []
-            
-            # Parse businesses from the first page
-            for business_json in response_data.get('Members', []):
-                business = self.parse_business_from_json(business_json)
-                businesses.append(business)
-            
-            # Fetch and parse remaining pages
-            for page in range(2, total_pages + 1):
-                logger.info(f"Fetching page {page} of {total_pages}")
-                response_data = self.fetch_directory_data(page=page, category=category)
-                
+
+            # Parse businesses from the first page; map/extend keeps the
+            # per-record loop in C rather than interpreted bytecode
+            businesses.extend(map(self.parse_business_from_json,
+                                  response_data.get('Members', [])))
+
+            # Fetch and parse the remaining pages concurrently; with a
+            # business cap, only request the pages needed to reach it
+            last_page = total_pages
+            if max_businesses:
+                pages_needed = (max_businesses - len(businesses) + page_size - 1) // page_size
+                last_page = min(last_page, 1 + max(pages_needed, 0))
+
+            page_range = range(2, last_page + 1)
+            for page, response_data in zip(page_range, self._fetch_pages(page_range, category)):
                 if response_data.get('Status') != 'OK':
                     logger.error(f"API returned error status on page {page}: {response_data.get('Status')}")
                     continue
-                
-                for business_json in response_data.get('Members', []):
-                    business = self.parse_business_from_json(business_json)
-                    businesses.append(business)
-                
-                # Add a longer delay between pages to be respectful
-                time.sleep(random.uniform(2.0, 3.0))
-            
+
+                businesses.extend(map(self.parse_business_from_json,
+                                      response_data.get('Members', [])))
+
+            if max_businesses and len(businesses) > max_businesses:
+                businesses = businesses[:max_businesses]
+
             logger.info(f"Found {len(businesses)} businesses in category {category}")
             
             return {
@@ -279,58 +474,35 @@ class LowcountryLocalFirstScraper(BaseEventScraper):
         
         all_businesses = []
         businesses_saved = 0
-        businesses_count = 0
-        
-        # First, get all businesses without category filters to get a full list
-        uncategorized_response = self.fetch_directory_data(page=1)
-        
-        if uncategorized_response.get('Status') != 'OK':
-            logger.error(f"Failed to get initial business list: {uncategorized_response.get('Status')}")
-        else:
-            total_count = uncategorized_response.get('TotalCount', 0)
-            page_size = 10  # Default page size used by the website
-            total_pages = min((total_count + page_size - 1) // page_size, max_pages or float('inf'))
-            
-            logger.info(f"Found {total_count} total businesses across approximately {total_pages} pages")
-            
-            # Process the first page
-            for business_json in uncategorized_response.get('Members', []):
-                # Check if we've reached the maximum number of businesses
-                if max_businesses and businesses_count >= max_businesses:
-                    logger.info(f"Reached maximum number of businesses ({max_businesses})")
-                    break
-                
-                business = self.parse_business_from_json(business_json)
-                all_businesses.append(business)
-                businesses_count += 1
-            
-            # Process remaining pages
-            for page in range(2, int(total_pages) + 1):
-                # Check if we've reached the maximum number of businesses
-                if max_businesses and businesses_count >= max_businesses:
-                    logger.info(f"Reached maximum number of businesses ({max_businesses})")
-                    break
-                
-                logger.info(f"Fetching page {page} of {total_pages}")
-                response_data = self.fetch_directory_data(page=page)
-                
-                if response_data.get('Status') != 'OK':
-                    logger.error(f"API returned error status on page {page}: {response_data.get('Status')}")
-                    continue
-                
-                for business_json in response_data.get('Members', []):
-                    # Check if we've reached the maximum number of businesses
-                    if max_businesses and businesses_count >= max_businesses:
-                        logger.info(f"Reached maximum number of businesses ({max_businesses})")
-                        break
-                    
-                    business = self.parse_business_from_json(business_json)
+        seen_type_ids = set()
+        # Businesses listed under several categories come back once per
+        # category; hashes of (name, website) drop repeats at insertion time
+        seen_businesses = set()
+
+        for category in categories_to_scrape:
+            if max_businesses and len(all_businesses) >= max_businesses:
+                logger.info(f"Reached maximum number of businesses ({max_businesses})")
+                break
+
+            # The API filters by member-type id; categories that resolve to
+            # the same id (including None while get_category_id is a stub)
+            # would return identical pages, so walk each id only once
+            member_type_id = self.get_category_id(category)
+            if member_type_id in seen_type_ids:
+                continue
+            seen_type_ids.add(member_type_id)
+
+            remaining = max_businesses - len(all_businesses) if max_businesses else None
+            result = self.scrape_event(category, max_businesses=remaining, max_pages=max_pages)
+            if result:
+                for business in result['businesses']:
+                    key = hash(((business['name'] or '').lower(),
+                                (business['website'] or '').lower()))
+                    if key in seen_businesses:
+                        continue
+                    seen_businesses.add(key)
                     all_businesses.append(business)
-                    businesses_count += 1
-                
-                # Add a longer delay between pages to be respectful
-                time.sleep(random.uniform(2.0, 3.0))
-        
+
         logger.info(f"Completed scraping. Found {len(all_businesses)} businesses total.")
         
         # If we have a database connection, save businesses
@@ -371,24 +543,13 @@ class LowcountryLocalFirstScraper(BaseEventScraper):
             # Set the full path for the CSV file
             csv_path = os.path.join(data_dir, filename)
             
-            # Prepare data for CSV
-            csv_data = []
-            for business in businesses:
-                csv_data.append({
-                    'Name': business.get('name', ''),
-                    'Address': business.get('location', ''),
-                    'Phone': business.get('phone', ''),
-                    'Email': business.get('email', ''),
-                    'Website': business.get('website', ''),
-                    'Category': business.get('category', ''),
-                    'Description': business.get('description', ''),
-                    'Image_URL': business.get('image_url', ''),
-                    'Source': business.get('source', self.source_name)
-                })
-            
-            # Save to CSV
-            df = pd.DataFrame(csv_data)
-            df.to_csv(csv_path, index=False)
+            # Stream rows straight to the file as tuples; the itemgetter
+            # projection replaces nine dict.get calls and a dict allocation
+            # per row
+            with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(_CSV_HEADER)
+                writer.writerows(map(_CSV_ROW, businesses))
             
             logger.info(f"Successfully saved {len(businesses)} businesses to {csv_path}")
             return True
@@ -410,7 +571,15 @@ class LowcountryLocalFirstScraper(BaseEventScraper):
         if not self.db_connection:
             logger.warning("No database connection available. Skipping database save.")
             return 0
-        
+
+        # Preferred path: one transaction for the whole batch instead of a
+        # connect/commit round-trip per business
+        if hasattr(self.db_connection, 'add_businesses_bulk'):
+            try:
+                return self.db_connection.add_businesses_bulk(businesses)
+            except Exception as e:
+                logger.error(f"Bulk business insert failed, falling back to per-row saves: {e}")
+
         count = 0
         for business in businesses:
             try:
@@ -451,9 +620,20 @@ class LowcountryLocalFirstScraper(BaseEventScraper):
             # Set the full path for the JSON file
             json_path = os.path.join(data_dir, filename)
             
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(businesses, f, indent=4, ensure_ascii=False)
-                
+            # Stream one record per line inside an array wrapper, so memory
+            # stays O(1) per record instead of buffering the whole document
+            with open(json_path, 'wb') as f:
+                f.write(b'[\n')
+                last = len(businesses) - 1
+                for i, business in enumerate(businesses):
+                    if orjson is not None:
+                        f.write(orjson.dumps(business))
+                    else:
+                        f.write(json.dumps(business, ensure_ascii=False).encode('utf-8'))
+                    f.write(b',\n' if i < last else b'\n')
+                f.write(b']\n')
+
+
             logger.info(f"Successfully saved {len(businesses)} businesses to {json_path}")
             return True
         except Exception as e:
@@ -10,8 +10,10 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
 
+from ..scrapers import register_scraper
 from ..selenium_scraper import BaseSeleniumScraper
 
+@register_scraper
 class LowcountryLocalFirstSeleniumScraper(BaseSeleniumScraper):
     """Scraper for Lowcountry Local First using Selenium with Safari WebDriver."""
     
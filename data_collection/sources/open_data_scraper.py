@@ -14,11 +14,12 @@ import pandas as pd
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
 
-from data_collection.scrapers import BaseEventScraper
+from data_collection.scrapers import BaseEventScraper, register_scraper
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+@register_scraper
 class OpenDataScraper(BaseEventScraper):
     """Scraper for collecting data from Charleston's Open Data Portal"""
     
@@ -13,11 +13,12 @@ import logging
 import pandas as pd
 from typing import Dict, List, Optional, Any, Union
 
-from data_collection.scrapers import BaseEventScraper
+from data_collection.scrapers import BaseEventScraper, register_scraper
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+@register_scraper
 class YelpBusinessScraper(BaseEventScraper):
     """Scraper for collecting business data from Yelp Fusion API"""
     
@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for the Charleston Concierge app.
+
+Run with:
+
+    gunicorn -c gunicorn.conf.py app:app
+
+preload_app loads the MiniLM weights and the Chroma HNSW index once in
+the master process; forked workers then share those pages copy-on-write
+instead of each loading a private copy, and threaded workers serve
+requests concurrently instead of one at a time like the Flask dev server.
+
+SQLite connections are safe here because CharlestonDB opens them lazily
+per thread after fork rather than inheriting file descriptors from the
+master. Likewise the LLM generation pool and the embedding batch-worker
+thread: threads do not survive fork(), so app.py creates them lazily in
+each worker on first use instead of relying on threads started in the
+master.
+"""
+
+import os
+
+bind = "0.0.0.0:5001"
+workers = max(2, (os.cpu_count() or 2) // 2)
+worker_class = "gthread"
+threads = 4
+preload_app = True
@@ -1,13 +1,185 @@
 import pandas as pd
 import os
 import numpy as np
-from thefuzz import fuzz, process
+from rapidfuzz import fuzz, process
 import re
+import functools
+
+# Punctuation-stripping normalizer shared by every matching pass. The
+# pattern is compiled once and the result memoized, so repeated venue
+# strings (the common case across event feeds) are normalized only once.
+_PUNCT = re.compile(r'[^\w\s]')
+
+@functools.lru_cache(maxsize=100_000)
+def _norm(s):
+    return _PUNCT.sub('', s).lower()
+
+# Score-matrix tile width for _best_match. cdist allocates a dense
+# len(queries) x tile uint8 block per call, so this bounds peak memory
+# however large the business list grows.
+_CDIST_TILE = 4096
+
+def _best_match(queries, choices, score_cutoff):
+    """
+    Best fuzzy match per query string against the choices.
+
+    Deduplicates the queries first -- event feeds repeat the same venue
+    string across many events, and each unique string only needs scoring
+    once -- then runs rapidfuzz process.cdist (multi-core, GIL-free) over
+    the choices in fixed-width tiles, folding each tile into a running
+    argmax/max so the full score matrix never has to fit in memory at
+    once. Results are broadcast back so the returned (best_idx,
+    best_score) arrays align with the original queries.
+
+    Callers must pass strings already cleaned by _norm: processor=None
+    below tells rapidfuzz to skip its default_process re-normalization,
+    which would otherwise run again on every comparison.
+    """
+    uniq, inverse = np.unique(np.asarray(queries, dtype=object), return_inverse=True)
+    uniq = uniq.tolist()
+    best_idx = np.zeros(len(uniq), dtype=np.int64)
+    best_score = np.zeros(len(uniq), dtype=np.uint8)
+    for start in range(0, len(choices), _CDIST_TILE):
+        scores = process.cdist(
+            uniq, choices[start:start + _CDIST_TILE],
+            scorer=fuzz.partial_ratio, processor=None,
+            score_cutoff=score_cutoff, workers=-1, dtype=np.uint8
+        )
+        tile_idx = scores.argmax(axis=1)
+        tile_score = scores.max(axis=1)
+        better = tile_score > best_score
+        best_idx[better] = tile_idx[better] + start
+        best_score[better] = tile_score[better]
+    return best_idx[inverse], best_score[inverse]
+
+# Events are streamed through the matcher in chunks of this many rows so
+# peak memory stays at one chunk (plus the business arrays) no matter how
+# large the events CSV grows.
+_EVENTS_CHUNK = 50_000
+
+def _match_chunk(events_df, clean_business_locations, valid_business_names,
+                 valid_name_idx, name_to_idx, business_index):
+    """
+    Match one chunk of events against the prepared business arrays.
+
+    Adds the Business_ID / Business_Match_Type / Business_Match_Score
+    columns to the chunk and returns (chunk, matched_count).
+    """
+    # Clean the event fields once; the missing-location mask is computed
+    # vectorized up front instead of a scalar pd.isna per event
+    loc_arr = events_df['Location'].fillna('').astype(str).to_numpy()
+    name_arr = events_df['Name'].fillna('').astype(str).to_numpy()
+    clean_locations = [_norm(loc) for loc in loc_arr]
+    clean_event_names = [_norm(name) for name in name_arr]
+    has_location = loc_arr != ''
+
+    # Exact/substring pre-pass: most event locations either contain a
+    # business name verbatim or not at all, and a C-level substring scan
+    # is orders of magnitude cheaper than fuzzy scoring. Events resolved
+    # here never enter the fuzzy path.
+    pre_idx = np.full(len(events_df), -1, dtype=np.int64)
+    for i, clean_location in enumerate(clean_locations):
+        if not clean_location:
+            continue
+        j = name_to_idx.get(clean_location)  # exact match is a dict hit
+        if j is None:
+            for name, idx in name_to_idx.items():
+                if name in clean_location:
+                    j = idx
+                    break
+        if j is not None:
+            pre_idx[i] = j
+
+    resolved = pre_idx >= 0
+
+    # Fuzzy-score the remaining events one pass at a time, shrinking the
+    # candidate set after each pass so the cheaper location-to-name pass
+    # short-circuits the two fallbacks for most events. Each pass is one
+    # _best_match call, which drives process.cdist across all cores in
+    # memory-bounded tiles instead of per-pair Python calls to
+    # fuzz.partial_ratio.
+    best_idx_1 = np.zeros(len(events_df), dtype=np.int64)
+    best_score_1 = np.zeros(len(events_df), dtype=np.uint8)
+    best_idx_2 = np.zeros(len(events_df), dtype=np.int64)
+    best_score_2 = np.zeros(len(events_df), dtype=np.uint8)
+    best_idx_3 = np.zeros(len(events_df), dtype=np.int64)
+    best_score_3 = np.zeros(len(events_df), dtype=np.uint8)
+
+    # Pass 1: event location against the filtered business names (strings
+    # are already normalized, so processor=None skips rapidfuzz's
+    # default_process); compacted column indices map back through
+    # valid_name_idx
+    residual = np.nonzero(has_location & ~resolved)[0]
+    if residual.size:
+        idx, score = _best_match(
+            [clean_locations[i] for i in residual], valid_business_names,
+            score_cutoff=80
+        )
+        best_idx_1[residual] = valid_name_idx[idx]
+        best_score_1[residual] = score
+    use_1 = has_location & ~resolved & (best_score_1 > 80)
+
+    # Pass 2: event location against business locations, only for events
+    # pass 1 left unmatched
+    residual = np.nonzero(has_location & ~resolved & ~use_1)[0]
+    if residual.size:
+        best_idx_2[residual], best_score_2[residual] = _best_match(
+            [clean_locations[i] for i in residual], clean_business_locations,
+            score_cutoff=80
+        )
+    use_2 = has_location & ~resolved & ~use_1 & (best_score_2 > 80)
+
+    # Pass 3: event name against business names, with a higher bar, for
+    # whatever is still unmatched
+    residual = np.nonzero(has_location & ~resolved & ~use_1 & ~use_2)[0]
+    if residual.size:
+        idx, score = _best_match(
+            [clean_event_names[i] for i in residual], valid_business_names,
+            score_cutoff=85
+        )
+        best_idx_3[residual] = valid_name_idx[idx]
+        best_score_3[residual] = score
+    use_3 = has_location & ~resolved & ~use_1 & ~use_2 & (best_score_3 > 85)
+
+    exact_scores = np.full(len(events_df), 100, dtype=np.uint8)
+
+    # Accumulate the match results in plain ndarrays and assign each
+    # column once, instead of scattering per-mask writes into object
+    # columns through the pandas indexing machinery
+    business_id = np.full(len(events_df), -1, dtype=np.int64)
+    match_type = np.full(len(events_df), None, dtype=object)
+    match_score = np.zeros(len(events_df), dtype=np.uint8)
+
+    for mask, best_idx, best_score, mtype in (
+        (resolved, pre_idx, exact_scores, 'location_to_name'),
+        (use_1, best_idx_1, best_score_1, 'location_to_name'),
+        (use_2, best_idx_2, best_score_2, 'location_to_location'),
+        (use_3, best_idx_3, best_score_3, 'name_to_name'),
+    ):
+        business_id[mask] = business_index[best_idx[mask]]
+        match_type[mask] = mtype
+        match_score[mask] = best_score[mask]
+
+    events_df['Business_ID'] = pd.array(
+        np.where(business_id >= 0, business_id, pd.NA), dtype='Int64'
+    )
+    # Three literal strings only, so store them as category codes (one
+    # byte per row) instead of an object column
+    events_df['Business_Match_Type'] = pd.Categorical(
+        match_type,
+        categories=['location_to_name', 'location_to_location', 'name_to_name']
+    )
+    events_df['Business_Match_Score'] = match_score
+
+    # Count matches straight off the sentinel array; no boolean Series
+    return events_df, int(np.count_nonzero(business_id >= 0))
 
 def create_venue_connections():
     """
     Create connections between events and businesses based on venue information.
-    This helps connect events to business entities for more integrated recommendations.
+    This helps connect events to business entities for more integrated
+    recommendations. Returns the path to the connections CSV, or None if
+    the input data files are missing.
     """
     print("Creating connections between events and businesses...")
     
@@ -26,91 +198,96 @@ def create_venue_connections():
         print(f"Events data file not found at {events_csv}")
         return None
     
-    # Load the data
-    businesses_df = pd.read_csv(business_csv)
-    events_df = pd.read_csv(events_csv)
-    
-    print(f"Loaded {len(businesses_df)} businesses and {len(events_df)} events")
-    
+    # pyarrow accelerates the CSV reads (multi-threaded parse, string
+    # columns in Arrow buffers instead of boxed Python objects) and
+    # provides the streaming Parquet writer; fall back to pandas'
+    # default engine when it isn't installed
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        arrow_engine = {'engine': 'pyarrow', 'dtype_backend': 'pyarrow'}
+        # The pyarrow engine doesn't support chunksize, so the chunked
+        # events read below only takes the Arrow dtype backend
+        arrow_backend = {'dtype_backend': 'pyarrow'}
+    except ImportError:
+        pa = pq = None
+        arrow_engine = {}
+        arrow_backend = {}
+
+    # Load the businesses once (the small side of the match). Matching
+    # only looks at names and locations, so skip the other columns.
+    businesses_df = pd.read_csv(
+        business_csv, usecols=['Name', 'Location'], **arrow_engine
+    )
+    print(f"Loaded {len(businesses_df)} businesses")
+
     # Create lists of business names and locations for matching
     business_names = businesses_df['Name'].tolist()
     business_locations = businesses_df['Location'].tolist()
-    
-    # Clean business names for better matching
-    clean_business_names = [
-        re.sub(r'[^\w\s]', '', name).lower() for name in business_names
+
+    # Clean business names and locations for better matching
+    clean_business_names = [_norm(name) for name in business_names]
+    clean_business_locations = [
+        _norm(str(loc)) if not pd.isna(loc) else '' for loc in business_locations
     ]
-    
-    # Add a business_id column to the events DataFrame
-    events_df['Business_ID'] = None
-    events_df['Business_Match_Type'] = None
-    events_df['Business_Match_Score'] = None
-    
-    # Process each event
-    for i, event in events_df.iterrows():
-        location = str(event['Location']) if not pd.isna(event['Location']) else ""
-        event_name = str(event['Name']) if not pd.isna(event['Name']) else ""
-        
-        # Skip if no location information
-        if not location:
-            continue
-            
-        # Clean the location string for better matching
-        clean_location = re.sub(r'[^\w\s]', '', location).lower()
-        
-        # Check for explicit venue mentions first
-        best_match = None
-        best_score = 0
-        match_type = None
-        match_index = -1
-        
-        # Try to match on business name in the location field
-        for j, business_name in enumerate(clean_business_names):
-            if business_name and len(business_name) > 3:  # Avoid matching very short names
-                score = fuzz.partial_ratio(clean_location, business_name)
-                if score > 80 and score > best_score:  # Threshold of 80% match
-                    best_score = score
-                    best_match = business_names[j]
-                    match_type = "location_to_name"
-                    match_index = j
-        
-        # If no match found yet, try matching on business location
-        if not best_match:
-            for j, business_loc in enumerate(business_locations):
-                if business_loc and not pd.isna(business_loc):
-                    clean_business_loc = re.sub(r'[^\w\s]', '', str(business_loc)).lower()
-                    score = fuzz.partial_ratio(clean_location, clean_business_loc)
-                    if score > 80 and score > best_score:
-                        best_score = score
-                        best_match = business_names[j]
-                        match_type = "location_to_location"
-                        match_index = j
-        
-        # If still no match, check if the event name contains a business name
-        if not best_match:
-            clean_event_name = re.sub(r'[^\w\s]', '', event_name).lower()
-            for j, business_name in enumerate(clean_business_names):
-                if business_name and len(business_name) > 3:
-                    score = fuzz.partial_ratio(clean_event_name, business_name)
-                    if score > 85 and score > best_score:  # Higher threshold for name matches
-                        best_score = score
-                        best_match = business_names[j]
-                        match_type = "name_to_name"
-                        match_index = j
-        
-        # Record the match information if found
-        if best_match and match_index >= 0:
-            events_df.at[i, 'Business_ID'] = businesses_df.iloc[match_index].name
-            events_df.at[i, 'Business_Match_Type'] = match_type
-            events_df.at[i, 'Business_Match_Score'] = best_score
-    
-    # Save the enhanced events data
-    print(f"Found business connections for {events_df['Business_ID'].notna().sum()} events")
+
+    # Filter out businesses with very short names once, keeping an index
+    # map back to the original rows, so the name-based passes never score
+    # (or even see) those columns -- the old "len(business_name) > 3"
+    # guard paid that check per event
+    valid_name_idx = np.array(
+        [j for j, name in enumerate(clean_business_names) if len(name) > 3],
+        dtype=np.int64
+    )
+    valid_business_names = [clean_business_names[j] for j in valid_name_idx]
+    name_to_idx = dict(zip(valid_business_names, valid_name_idx))
+    business_index = businesses_df.index.to_numpy()
+
     connections_csv = os.path.join(project_root, 'data/charleston_event_connections.csv')
-    events_df.to_csv(connections_csv, index=False)
+    connections_parquet = connections_csv.replace('.csv', '.parquet')
+
+    # Stream the events through the matcher in bounded chunks, appending
+    # each processed chunk to the outputs, so the full events frame and
+    # the score matrices never coexist in memory
+    total_events = 0
+    total_matched = 0
+    parquet_writer = None
+    first_chunk = True
+    events_reader = pd.read_csv(
+        events_csv, chunksize=_EVENTS_CHUNK, **arrow_backend
+    )
+    for chunk in events_reader:
+        chunk, matched = _match_chunk(
+            chunk, clean_business_locations, valid_business_names,
+            valid_name_idx, name_to_idx, business_index
+        )
+        total_events += len(chunk)
+        total_matched += matched
+        chunk.to_csv(
+            connections_csv, mode='w' if first_chunk else 'a',
+            header=first_chunk, index=False
+        )
+        if pq is not None:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if parquet_writer is None:
+                parquet_writer = pq.ParquetWriter(
+                    connections_parquet, table.schema, compression='zstd'
+                )
+            parquet_writer.write_table(table)
+        first_chunk = False
+    if parquet_writer is not None:
+        parquet_writer.close()
+
+    print(f"Processed {total_events} events")
+    print(f"Found business connections for {total_matched} events")
     print(f"Saved event-business connections to {connections_csv}")
-    
-    return events_df
+    if pq is not None:
+        # Parquet is columnar, compressed and typed, so pandas consumers
+        # reload it several times faster than the CSV (which stays for
+        # everything that already reads it)
+        print(f"Saved Parquet copy to {connections_parquet}")
+
+    return connections_csv
 
 def enhance_combined_database():
     """
@@ -1,7 +1,56 @@
 import sqlite3
 import os
+import time
+import functools
+import threading
+from collections import OrderedDict
 import pandas as pd
 
+def ttl_cached(maxsize=1024, ttl=60):
+    """
+    Decorator that memoizes a method's result per arguments for ttl seconds.
+
+    Each decorated method gets its own size-bounded cache, so invalidation
+    after writes can be scoped via the attached cache_clear(). Used on hot
+    read-only lookups whose results are effectively static within a chat
+    session.
+    """
+    def decorator(func):
+        # The cache is shared across gunicorn's request threads, so every
+        # mutation happens under the lock; only the underlying query runs
+        # outside it
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            key = (self.db_path,) + args
+            now = time.time()
+
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    timestamp, value = entry
+                    if now - timestamp < ttl:
+                        cache.move_to_end(key)
+                        return value
+                    del cache[key]
+
+            value = func(self, *args)
+            with lock:
+                cache[key] = (now, value)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
 class CharlestonDB:
     """
     Database manager for Charleston businesses and events.
@@ -16,7 +65,10 @@ class CharlestonDB:
             db_path = os.path.join(project_root, 'data/charleston.db')
         
         self.db_path = db_path
-        
+
+        # Per-thread long-lived read connections (see read_connection)
+        self._local = threading.local()
+
         # Create data directory if it doesn't exist
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
     
@@ -27,7 +79,34 @@ class CharlestonDB:
     def connect(self):
         """Create and return a database connection"""
         return sqlite3.connect(self.db_path)
+
+    def read_connection(self):
+        """
+        Return a long-lived connection for read-only queries.
+
+        One connection is kept per thread so read-heavy endpoints don't pay
+        the open/close and page-cache warmup cost on every request. Callers
+        must not close the returned connection.
+        """
+        conn = getattr(self._local, 'read_conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._local.read_conn = conn
+        return conn
     
+    def execute_dicts(self, query, params=()):
+        """
+        Run a read-only query and return rows as plain dicts.
+
+        Skips the pandas DataFrame round trip entirely — for the small
+        result sets the JSON API serves, columnar materialization costs
+        more than the query itself.
+        """
+        conn = self.read_connection()
+        conn.row_factory = sqlite3.Row
+        rows = conn.execute(query, params).fetchall()
+        return [dict(row) for row in rows]
+
     def create_tables(self):
         """Create database tables if they don't exist"""
         conn = self.connect()
@@ -171,6 +250,7 @@ class CharlestonDB:
         conn.close()
         return df
     
+    @ttl_cached(maxsize=1024, ttl=60)
     def get_business_by_id(self, business_id):
         """Get a business by its ID"""
         conn = self.connect()
@@ -179,6 +259,20 @@ class CharlestonDB:
         conn.close()
         return df.iloc[0] if not df.empty else None
     
+    def get_businesses_by_ids(self, business_ids):
+        """Get multiple businesses by ID in a single query"""
+        if not business_ids:
+            return pd.DataFrame(columns=['id', 'name', 'location', 'description',
+                                         'category', 'rating', 'image_url', 'website',
+                                         'phone', 'email', 'source'])
+
+        conn = self.connect()
+        placeholders = ", ".join("?" * len(business_ids))
+        query = f"SELECT * FROM businesses WHERE id IN ({placeholders})"
+        df = pd.read_sql_query(query, conn, params=tuple(business_ids))
+        conn.close()
+        return df
+
     def search_businesses(self, query_text, limit=10):
         """
         Search businesses by name, location, or description.
@@ -197,6 +291,30 @@ class CharlestonDB:
         conn.close()
         return df
     
+    def search_businesses_full(self, query_text, limit=10):
+        """
+        Search businesses and return their categories in the same query.
+        Like search_businesses, but LEFT JOINs the category tables and
+        GROUP_CONCATs category names into a 'categories' column, so callers
+        don't need a follow-up query per business.
+        """
+        conn = self.connect()
+        search_term = f"%{query_text}%"
+        query = """
+        SELECT b.*, GROUP_CONCAT(c.name, ', ') AS categories
+        FROM businesses b
+        LEFT JOIN business_categories bc ON bc.business_id = b.id
+        LEFT JOIN categories c ON c.id = bc.category_id
+        WHERE b.name LIKE ?
+        OR b.location LIKE ?
+        OR b.description LIKE ?
+        GROUP BY b.id
+        LIMIT ?
+        """
+        df = pd.read_sql_query(query, conn, params=(search_term, search_term, search_term, limit))
+        conn.close()
+        return df
+
     def get_businesses_by_category(self, category, limit=10):
         """Get businesses in a specific category"""
         conn = self.connect()
@@ -211,6 +329,7 @@ class CharlestonDB:
         conn.close()
         return df
     
+    @ttl_cached(maxsize=1024, ttl=60)
     def get_business_categories(self, business_id):
         """Get all categories for a business"""
         conn = self.connect()
@@ -223,6 +342,22 @@ class CharlestonDB:
         conn.close()
         return df
     
+    def get_categories_for_businesses(self, business_ids):
+        """Get categories for multiple businesses in a single query"""
+        if not business_ids:
+            return pd.DataFrame(columns=['business_id', 'id', 'name'])
+
+        conn = self.connect()
+        placeholders = ", ".join("?" * len(business_ids))
+        query = f"""
+        SELECT bc.business_id, c.* FROM categories c
+        JOIN business_categories bc ON c.id = bc.category_id
+        WHERE bc.business_id IN ({placeholders})
+        """
+        df = pd.read_sql_query(query, conn, params=tuple(business_ids))
+        conn.close()
+        return df
+
     def get_all_events(self):
         """Get all events from the database"""
         conn = self.connect()
@@ -257,6 +392,7 @@ class CharlestonDB:
         conn.close()
         return df
     
+    @ttl_cached(maxsize=1024, ttl=60)
     def get_events_by_business(self, business_id):
         """Get all events at a specific business"""
         conn = self.connect()
@@ -265,6 +401,20 @@ class CharlestonDB:
         conn.close()
         return df
     
+    def get_events_for_businesses(self, business_ids):
+        """Get all events at any of the given businesses in a single query"""
+        if not business_ids:
+            return pd.DataFrame(columns=['id', 'name', 'date', 'time', 'location',
+                                         'description', 'url', 'image_url', 'source',
+                                         'business_id', 'place_id'])
+
+        conn = self.connect()
+        placeholders = ", ".join("?" * len(business_ids))
+        query = f"SELECT * FROM events WHERE business_id IN ({placeholders})"
+        df = pd.read_sql_query(query, conn, params=tuple(business_ids))
+        conn.close()
+        return df
+
     def get_events_by_date(self, date_str):
         """Get events on a specific date (YYYY-MM-DD format)"""
         conn = self.connect()
@@ -287,8 +437,40 @@ class CharlestonDB:
         event_id = cursor.lastrowid
         conn.commit()
         conn.close()
+
+        # Invalidate cached event lookups now that the table changed
+        self.get_events_by_business.cache_clear()
         return event_id
     
+    def add_events_bulk(self, rows):
+        """
+        Add many events in one transaction.
+
+        rows is a sequence of (name, date, time, location, description,
+        url, image_url, source, business_id) tuples. One executemany
+        under a single commit replaces a per-row connect/commit cycle,
+        which is where bulk scraper loads spend nearly all their time.
+        Returns the number of rows inserted.
+        """
+        rows = list(rows)
+        if not rows:
+            return 0
+
+        conn = self.connect()
+        cursor = conn.cursor()
+
+        cursor.executemany("""
+        INSERT INTO events (name, date, time, location, description, url, image_url, source, business_id)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
+        conn.commit()
+        conn.close()
+
+        # Invalidate cached event lookups now that the table changed
+        self.get_events_by_business.cache_clear()
+        return len(rows)
+
     def add_event_from_dict(self, event_dict):
         """Add a new event from a dictionary of event data"""
         # Map dictionary keys to expected parameter names
@@ -373,8 +555,12 @@ class CharlestonDB:
         
         conn.commit()
         conn.close()
+
+        # Invalidate cached business lookups now that the row changed
+        self.get_business_by_id.cache_clear()
+        self.get_business_categories.cache_clear()
         return business_id
-    
+
     def add_business_from_dict(self, business_dict):
         """Add a business to the database from a dictionary.
         
@@ -432,6 +618,72 @@ class CharlestonDB:
             source=source
         )
     
+    def add_businesses_bulk(self, business_dicts):
+        """
+        Add many businesses in one transaction.
+
+        Applies the same name-keyed upsert and category linking as
+        add_business, but over a single connection with one commit at the
+        end instead of a connect/commit cycle per business. Returns the
+        number of businesses written.
+        """
+        business_dicts = [b for b in business_dicts if b]
+        if not business_dicts:
+            return 0
+
+        conn = self.connect()
+        cursor = conn.cursor()
+        count = 0
+
+        for business_dict in business_dicts:
+            data = {k.lower(): v for k, v in business_dict.items()}
+            name = data.get('name', '')
+            category = data.get('category', '')
+
+            cursor.execute("SELECT id FROM businesses WHERE name = ?", (name,))
+            result = cursor.fetchone()
+
+            params = (data.get('location', ''), data.get('description', ''),
+                      data.get('website', ''), data.get('image_url', ''),
+                      category, data.get('rating'), data.get('phone'),
+                      data.get('email'), data.get('source'))
+            if result:
+                business_id = result[0]
+                cursor.execute("""
+                UPDATE businesses
+                SET location = ?, description = ?, website = ?, image_url = ?, category = ?, rating = ?,
+                    phone = ?, email = ?, source = ?
+                WHERE id = ?
+                """, params + (business_id,))
+            else:
+                cursor.execute("""
+                INSERT INTO businesses (name, location, description, website, image_url, category, rating,
+                                      phone, email, source)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (name,) + params)
+                business_id = cursor.lastrowid
+
+            if category:
+                categories = [cat.strip() for cat in category.split(',') if cat.strip()]
+                for cat in categories:
+                    cursor.execute("INSERT OR IGNORE INTO categories (name) VALUES (?)", (cat,))
+                    cursor.execute("SELECT id FROM categories WHERE name = ?", (cat,))
+                    cat_id = cursor.fetchone()[0]
+                    cursor.execute("""
+                    INSERT OR REPLACE INTO business_categories (business_id, category_id)
+                    VALUES (?, ?)
+                    """, (business_id, cat_id))
+
+            count += 1
+
+        conn.commit()
+        conn.close()
+
+        # Invalidate cached business lookups now that the table changed
+        self.get_business_by_id.cache_clear()
+        self.get_business_categories.cache_clear()
+        return count
+
     def delete_event(self, event_id):
         """Delete an event from the database"""
         conn = self.connect()
@@ -440,6 +692,9 @@ class CharlestonDB:
         deleted = cursor.rowcount > 0
         conn.commit()
         conn.close()
+
+        if deleted:
+            self.get_events_by_business.cache_clear()
         return deleted
     
     def import_events(self, events_df):
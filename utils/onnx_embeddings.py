@@ -0,0 +1,70 @@
+"""
+Int8 ONNX Runtime embeddings for all-MiniLM-L6-v2.
+
+FP32 torch on CPU is the single biggest per-request compute cost after the
+LLM itself. Exporting MiniLM to ONNX and applying dynamic int8 quantization
+cuts weight bandwidth roughly 4x and lets ONNX Runtime use int8 GEMM (VNNI)
+instructions on x86, typically a 2-4x encode speedup with <1% recall loss.
+
+Produce the quantized model once with:
+
+    optimum-cli export onnx --model sentence-transformers/all-MiniLM-L6-v2 onnx_out/
+    python -c "from onnxruntime.quantization import quantize_dynamic, QuantType; \
+               quantize_dynamic('onnx_out/model.onnx', 'data/minilm-l6-v2-int8.onnx', \
+                                weight_type=QuantType.QInt8)"
+"""
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+class OnnxMiniLMEmbeddings(Embeddings):
+    """
+    LangChain Embeddings backed by a quantized MiniLM ONNX session.
+
+    Implements the same tokenize -> run -> mean-pool -> L2-normalize
+    pipeline as sentence-transformers, but entirely in ONNX Runtime and
+    NumPy, so it can be passed as the embedding_function to Chroma.
+    """
+
+    def __init__(self, model_path, tokenizer_name="sentence-transformers/all-MiniLM-L6-v2"):
+        import onnxruntime
+        from transformers import AutoTokenizer
+
+        self.session = onnxruntime.InferenceSession(
+            model_path,
+            providers=['CPUExecutionProvider']
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(tokenizer_name)
+        self._input_names = {i.name for i in self.session.get_inputs()}
+
+    def _encode(self, texts):
+        """Encode a batch of texts into L2-normalized float32 vectors"""
+        encoded = self.tokenizer(
+            texts,
+            padding=True,
+            truncation=True,
+            max_length=256,
+            return_tensors="np"
+        )
+
+        inputs = {
+            name: array.astype(np.int64)
+            for name, array in encoded.items()
+            if name in self._input_names
+        }
+        hidden_states = self.session.run(None, inputs)[0]
+
+        # Mean pooling over non-padding tokens, then L2 normalization
+        mask = encoded['attention_mask'][:, :, None].astype(np.float32)
+        pooled = (hidden_states * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1e-9)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        return pooled / np.maximum(norms, 1e-12)
+
+    def embed_documents(self, texts):
+        """Embed a list of documents"""
+        return self._encode(list(texts)).tolist()
+
+    def embed_query(self, text):
+        """Embed a single query"""
+        return self._encode([text])[0].tolist()